@@ -46,6 +46,9 @@ from wallGoExampleBase import ExampleInputPoint  # pylint: disable=C0411, C0413,
 if TYPE_CHECKING:
     import WallGoCollision
 
+# Prefactor of the thermal cubic term, 1/(12 pi) (3 + 3^{3/2})
+_CUBIC_PREFACTOR = (3 + 3**1.5) / (12 * np.pi)
+
 
 class StandardModel(GenericModel):
     r"""
@@ -312,14 +315,17 @@ class EffectivePotentialSM(EffectivePotential):
         # to avoid taking the square root of a negative number
         eT: float | np.ndarray = (
             self.modelParameters["E0"]
-            + 1 / (12 * np.pi) * (3 + 3**1.5) * np.abs(lambdaT) ** 1.5
+            + _CUBIC_PREFACTOR * np.abs(lambdaT) ** 1.5
         )
 
+        # Integer powers as products, reusing v^2 and T^2
+        vSq = v * v
+        TSq = T * T
         potentialT: float | np.ndarray = (
-            self.modelParameters["D"] * (T**2 - self.modelParameters["T0sq"]) * v**2
-            - cT * T**2 * pow(v, 2) * np.log(np.abs(v / T))
-            - eT * T * pow(v, 3)
-            + lambdaT / 4 * pow(v, 4)
+            self.modelParameters["D"] * (TSq - self.modelParameters["T0sq"]) * vSq
+            - cT * TSq * vSq * np.log(np.abs(v / T))
+            - eT * T * vSq * v
+            + lambdaT / 4 * vSq * vSq
         )
 
         potentialTotal = np.real(potentialT + self.constantTerms(T))
@@ -8,6 +8,12 @@ from enum import Enum, auto
 import typing
 import numpy as np
 
+try:
+    import numexpr
+except ImportError:
+    # Optional. Without it the NumPy implementation of jCW is used
+    numexpr = None
+
 from ..effectivePotential import EffectivePotential
 from ..interpolatableFunction import EExtrapolationType
 
@@ -42,6 +48,18 @@ class EffectivePotentialNoResum(EffectivePotential, ABC):
 
     SMALL_NUMBER: typing.Final[float] = 1e-100
 
+    # Prefactors of the one-loop potentials
+    _INV_64_PI_SQ: typing.Final[float] = 1.0 / (64.0 * np.pi * np.pi)
+    _INV_2_PI_SQ: typing.Final[float] = 1.0 / (2.0 * np.pi * np.pi)
+
+    NUMEXPR_MIN_SIZE: int = 4096
+    """Smallest mass array for which jCW is evaluated with numexpr, if installed."""
+
+    JCW_BLOCK_SIZE: int = 4096
+    """Number of field points per block when summing the Coleman-Weinberg
+    potential over large arrays. Chosen so that the temporaries of one block fit
+    in a typical L2 cache."""
+
     def __init__(
         self,
         integrals: Integrals = None,
@@ -230,12 +248,133 @@ class EffectivePotentialNoResum(EffectivePotential, ABC):
         jCW : float or array_like
             One-loop Coleman-Weinberg potential for given particle spectrum.
         """
-        smallImagNumber = EffectivePotentialNoResum.SMALL_NUMBER * 1j
+        result = EffectivePotentialNoResum._jCWPerDegreeOfFreedom(massSq, c, rgScale)
+        # Not in place, as degreesOfFreedom may broadcast to a larger shape
+        return result * (degreesOfFreedom * EffectivePotentialNoResum._INV_64_PI_SQ)
+
+    @staticmethod
+    def _jCWPerDegreeOfFreedom(
+        massSq: np.ndarray,
+        c: float | np.ndarray,
+        rgScale: float | np.ndarray,
+    ) -> np.ndarray:
+        """Computes massSq^2 * (log(massSq/rgScale^2) - c), i.e. jCW without the
+        degrees of freedom and the overall 1/(64 pi^2).
+        """
+        # Invert the (per-particle) scale once and multiply, instead of dividing
+        # every element of massSq
+        invRgScaleSq = 1.0 / (np.asarray(rgScale, dtype=float) ** 2)
+
+        smallNumber: float | complex
+        if np.min(massSq, initial=np.inf) >= 0:
+            # Common case: no imaginary parts, so stay in real arithmetic. The
+            # small number keeps massSq = 0 finite, as in the complex branch
+            smallNumber = EffectivePotentialNoResum.SMALL_NUMBER
+        else:
+            smallNumber = EffectivePotentialNoResum.SMALL_NUMBER * 1j
+
+        if (
+            numexpr is not None
+            and np.size(massSq) >= EffectivePotentialNoResum.NUMEXPR_MIN_SIZE
+        ):
+            # numexpr evaluates the whole expression in one multithreaded pass
+            # without temporaries. For small arrays its call overhead dominates
+            return numexpr.evaluate(
+                "massSq * massSq * (log(massSq * invRgScaleSq + smallNumber) - c)",
+                local_dict={
+                    "massSq": np.asarray(massSq, dtype=float),
+                    "invRgScaleSq": invRgScaleSq,
+                    "smallNumber": smallNumber,
+                    "c": np.asarray(c, dtype=float),
+                },
+            )
+
+        # Build the result in a single buffer with in-place operations, so that
+        # only the logarithm allocates a full-size array
+        result = np.log(massSq * invRgScaleSq + smallNumber)
+        result -= c
+        result *= massSq
+        result *= massSq
+        return result
+
+    @staticmethod
+    def _sumOverParticles(
+        terms: np.ndarray, degreesOfFreedom: float | np.ndarray
+    ) -> np.ndarray:
+        """Computes np.sum(degreesOfFreedom * terms, axis=-1). For a d.o.f. vector
+        with one entry per particle this is a matrix-vector product, which weights
+        and sums in a single pass. Anything else, e.g. a length-1 vector broadcast
+        over all particles, goes through the plain sum.
+        """
+        degreesOfFreedom = np.asarray(degreesOfFreedom)
+        if (
+            degreesOfFreedom.ndim == 1
+            and np.ndim(terms) > 0
+            and degreesOfFreedom.shape[-1] == np.shape(terms)[-1]
+        ):
+            return terms @ degreesOfFreedom
+        return np.sum(terms * degreesOfFreedom, axis=-1)
+
+    def _sumJCW(
+        self,
+        massSq: np.ndarray,
+        degreesOfFreedom: int | np.ndarray,
+        c: float | np.ndarray,
+        rgScale: float | np.ndarray,
+    ) -> float | np.ndarray:
+        """Sum of jCW over the particle index, which is the last axis of massSq.
+
+        With the default jCW the degrees of freedom are contracted with a
+        matrix-vector product, which does the multiplication and the sum in a
+        single pass. Subclasses overriding jCW go through the plain sum.
+        """
+        if type(self).jCW is not EffectivePotentialNoResum.jCW:
+            return np.sum(self.jCW(massSq, degreesOfFreedom, c, rgScale), axis=-1)
+
+        massSq = np.asarray(massSq)
+        degreesOfFreedom = np.asarray(degreesOfFreedom)
+
+        def blockSum(massSqBlock: np.ndarray) -> np.ndarray:
+            return self._sumOverParticles(
+                self._jCWPerDegreeOfFreedom(massSqBlock, c, rgScale), degreesOfFreedom
+            )
+
+        blockSize = self.JCW_BLOCK_SIZE
+        if (
+            massSq.ndim < 2
+            or massSq.size // massSq.shape[-1] <= blockSize
+            or max(np.ndim(c), np.ndim(rgScale), degreesOfFreedom.ndim) > 1
+        ):
+            return blockSum(massSq) * self._INV_64_PI_SQ
+
+        # Large inputs are processed in blocks of points so that the
+        # intermediate arrays stay in cache
+        massSqFlat = massSq.reshape(-1, massSq.shape[-1])
+        blocks = [
+            blockSum(massSqFlat[i : i + blockSize])
+            for i in range(0, massSqFlat.shape[0], blockSize)
+        ]
+        result = np.concatenate(blocks).reshape(massSq.shape[:-1])
+        return result * self._INV_64_PI_SQ
+
+    @staticmethod
+    def _spectrumAsArrays(
+        particles: tuple,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Converts a (massSq, degreesOfFreedom, c, rgScale) tuple, as returned by
+        bosonInformation and fermionInformation, to float64 arrays.
+
+        Python scalars and integer arrays are converted once here, so that the
+        elementwise operations downstream do not each repeat the conversion.
+        Inputs that already are float64 arrays are not copied.
+        """
+        massSq, degreesOfFreedom, c, rgScale = particles
         return (
-            degreesOfFreedom
-            * massSq**2
-            * (np.log(massSq / rgScale**2 + smallImagNumber) - c)
-        ) / (64 * np.pi * np.pi)
+            np.asarray(massSq, dtype=float),
+            np.asarray(degreesOfFreedom, dtype=float),
+            np.asarray(c, dtype=float),
+            np.asarray(rgScale, dtype=float),
+        )
 
     def potentialOneLoop(
         self, bosons: tuple, fermions: tuple
@@ -257,27 +396,33 @@ class EffectivePotentialNoResum(EffectivePotential, ABC):
         potential : float or array_like
         """
 
-        massSqB, nB, cB, rgScaleB = bosons
-        massSqF, nF, cF, rgScaleF = fermions
+        massSqB, nB, cB, rgScaleB = self._spectrumAsArrays(bosons)
+        massSqF, nF, cF, rgScaleF = self._spectrumAsArrays(fermions)
 
         if self.imaginaryOption == EImaginaryOption.ABS_ARGUMENT:
             # one way to drop imaginary parts, replace x with |x|
             massSqB = abs(massSqB)
             massSqF = abs(massSqF)
 
+        # Smallest masses, found with a single reduction per array. These
+        # decide whether imaginary parts can arise and are reported on error
+        msqBMin = np.min(massSqB, initial=np.inf)
+        msqFMin = np.min(massSqF, initial=np.inf)
+
         # constructing the potential
-        potential = np.sum(self.jCW(massSqB, nB, cB, rgScaleB), axis=-1)
-        potential -= np.sum(self.jCW(massSqF, nF, cF, rgScaleF), axis=-1)
+        # Not in place: the boson sum is real when all boson masses are
+        # nonnegative, while the fermion sum can still be complex
+        potential = self._sumJCW(massSqB, nB, cB, rgScaleB) - self._sumJCW(
+            massSqF, nF, cF, rgScaleF
+        )
 
         # checking for imaginary parts
-        if np.any(massSqB < 0) or np.any(massSqF < 0):
+        if msqBMin < 0 or msqFMin < 0:
             if self.imaginaryOption == EImaginaryOption.PRINCIPAL_PART:
                 potential = np.real(potential)
             elif self.imaginaryOption == EImaginaryOption.ABS_RESULT:
                 potential = abs(potential)
             elif self.imaginaryOption == EImaginaryOption.ERROR:
-                msqBMin = np.min(massSqB)
-                msqFMin = np.min(massSqF)
                 raise ValueError(
                     f"Im(Veff)={potential.imag}, Re(Veff)={np.real(potential)}, min(msqB)={msqBMin}, min(msqF)={msqFMin}. "
                     "Choose imaginaryOption != EImaginaryOption.ERROR "
@@ -314,47 +459,70 @@ class EffectivePotentialNoResum(EffectivePotential, ABC):
         # m2 is shape (len(T), 5), so to divide by T we need to transpose T,
         # or add new axis in this case.
         # But make sure we don't modify the input temperature array here.
-        temperature = np.asanyarray(temperature)
+        temperature = np.asarray(temperature, dtype=float)
 
         temperatureSq = temperature**2 + self.SMALL_NUMBER
 
-        # Need reshaping mess for numpy broadcasting to work
-        if temperatureSq.ndim > 0:
-            temperatureSq = temperatureSq[:, np.newaxis]
+        # Trailing axis for broadcasting against the particle index. This works
+        # the same way for scalar and array temperatures, (1,) or (len(T), 1).
+        # The inverse is taken on the temperature array, so that the much larger
+        # mass arrays are multiplied instead of divided
+        invTemperatureSq = np.expand_dims(1.0 / temperatureSq, -1)
 
         # Jb, Jf take (mass/T)^2 as input, np.array is OK.
         # Do note that for negative m^2 the integrals become wild and convergence
         # is both slow and bad, so you may want to consider taking the absolute
         # value of m^2. We will not enforce this however
 
-        massSqB, nB, _, _ = bosons
-        massSqF, nF, _, _ = fermions
+        massSqB, nB, _, _ = self._spectrumAsArrays(bosons)
+        massSqF, nF, _, _ = self._spectrumAsArrays(fermions)
+
+        # The product allocates a fresh array, which we are free to modify
+        # in place. The input mass arrays are left untouched.
+        xB = np.asarray(massSqB * invTemperatureSq)
+        xF = np.asarray(massSqF * invTemperatureSq)
 
         if self.imaginaryOption == EImaginaryOption.ABS_ARGUMENT:
-            # one way to drop imaginary parts, replace x with |x|
-            massSqB = np.abs(massSqB)
-            massSqF = np.abs(massSqF)
+            # one way to drop imaginary parts, replace x with |x|.
+            # Since T^2 > 0 this is the same as |m^2|/T^2
+            xB = np.abs(xB, out=xB)
+            xF = np.abs(xF, out=xF)
+            # the imaginary part check below then sees the absolute values
+            massSqB = xB
+            massSqF = xF
 
         # Careful with the sum, it needs to be column-wise.
         # Otherwise things go horribly wrong with array T input.
         # TODO: really not a fan of hardcoded axis index
 
+        msqBMin = np.min(massSqB, initial=np.inf)
+        msqFMin = np.min(massSqF, initial=np.inf)
+
         # constructing the potential
-        JbList = self.integrals.Jb(massSqB / temperatureSq)
-        JfList = self.integrals.Jf(massSqF / temperatureSq)
-        potential = np.sum(nB * np.asarray(JbList)[..., 0], axis=-1)
-        potential += np.sum(nF * np.asarray(JfList)[..., 0], axis=-1)
-        potential = potential * temperature**4 / (2 * np.pi * np.pi)
+        # Jb and Jf return ndarrays with the real and imaginary parts on the
+        # last axis. Only the real part enters, taken as a view
+        JbReal = self.integrals.Jb(xB)[..., 0]
+        JfReal = self.integrals.Jf(xF)[..., 0]
+        if JbReal.shape != xB.shape or JfReal.shape != xF.shape:
+            raise ValueError(
+                "EffectivePotentialNoResum error: Jb and Jf must return arrays of "
+                "shape x.shape + (2,), with the real and imaginary parts on the last "
+                f"axis. Got Jb(x): {JbReal.shape} for x: {xB.shape} and Jf(x): "
+                f"{JfReal.shape} for x: {xF.shape}."
+            )
+        potential = self._sumOverParticles(JbReal, nB)
+        potential += self._sumOverParticles(JfReal, nF)
+        # T^4 from the T^2 we already have: a multiply instead of a pow. The
+        # SMALL_NUMBER shift only changes this at relative order 1e-100/T^2
+        potential = potential * (temperatureSq * temperatureSq * self._INV_2_PI_SQ)
 
         # checking for imaginary parts
-        if np.any(massSqB < 0) or np.any(massSqF < 0):
+        if msqBMin < 0 or msqFMin < 0:
             if self.imaginaryOption == EImaginaryOption.PRINCIPAL_PART:
                 potential = np.real(potential)
             elif self.imaginaryOption == EImaginaryOption.ABS_RESULT:
                 potential = abs(potential)
             elif self.imaginaryOption == EImaginaryOption.ERROR:
-                msqBMin = np.min(massSqB)
-                msqFMin = np.min(massSqF)
                 raise ValueError(
                     f"Im(VT)={potential.imag}, Re(VT)={np.real(potential)}, min(msqB)={msqBMin}, min(msqF)={msqFMin}. "
                     "Choose imaginaryOption != EImaginaryOption.ERROR "
@@ -1,63 +1,135 @@
 """Initialising WallGo package"""
 
-import types
+import typing
 import warnings
 import importlib
 
-# package level modules
-from .boltzmann import BoltzmannSolver
-from .config import Config
-from .collisionArray import CollisionArray
-from .containers import PhaseInfo, BoltzmannBackground, BoltzmannDeltas, WallParams
-from .effectivePotential import EffectivePotential, VeffDerivativeSettings
-from .exceptions import WallGoError, WallGoPhaseValidationError, CollisionLoadError
-from .fields import Fields
-from .freeEnergy import FreeEnergy
-from .genericModel import GenericModel
-from .grid import Grid
-from .grid3Scales import Grid3Scales
-from .hydrodynamics import Hydrodynamics
-from .hydrodynamicsTemplateModel import HydrodynamicsTemplateModel
-from .interpolatableFunction import InterpolatableFunction, EExtrapolationType
-from .manager import WallGoManager, WallSolverSettings
-from .particle import Particle
-from .polynomial import Polynomial
-from .thermodynamics import Thermodynamics
-from .equationOfMotion import EOM
-from .results import WallGoResults
-from .utils import getSafePathToResource
-
-# list of submodules for lazy importing
-submodules = ["PotentialTools"]
-
-
-def __getattr__(name: str) -> types.ModuleType:    # pylint: disable=invalid-name
-    """Lazy subpackage import, following Numpy and Scipy"""
-    if name in submodules:
-        return importlib.import_module(f'WallGo.{name}')
-    try:
-        return globals()[name]
-    except KeyError as esc:
-        raise AttributeError(f"Module 'WallGo' has no attribute '{name}'") from esc
+# Package level names and the modules they are defined in. These are imported
+# lazily on first access (PEP 562), so that `import WallGo` stays cheap when only
+# a part of WallGo is needed. The heavy dependencies (findiff, sympy, h5py,
+# scipy.integrate) are only loaded by the modules that use them.
+_lazyAttributes: dict[str, str] = {
+    "BoltzmannSolver": "boltzmann",
+    "Config": "config",
+    "CollisionArray": "collisionArray",
+    "PhaseInfo": "containers",
+    "BoltzmannBackground": "containers",
+    "BoltzmannDeltas": "containers",
+    "WallParams": "containers",
+    "EffectivePotential": "effectivePotential",
+    "VeffDerivativeSettings": "effectivePotential",
+    "WallGoError": "exceptions",
+    "WallGoPhaseValidationError": "exceptions",
+    "CollisionLoadError": "exceptions",
+    "Fields": "fields",
+    "FreeEnergy": "freeEnergy",
+    "GenericModel": "genericModel",
+    "Grid": "grid",
+    "Grid3Scales": "grid3Scales",
+    "Hydrodynamics": "hydrodynamics",
+    "HydrodynamicsTemplateModel": "hydrodynamicsTemplateModel",
+    "InterpolatableFunction": "interpolatableFunction",
+    "EExtrapolationType": "interpolatableFunction",
+    "WallGoManager": "manager",
+    "WallSolverSettings": "manager",
+    "Particle": "particle",
+    "Polynomial": "polynomial",
+    "Thermodynamics": "thermodynamics",
+    "EOM": "equationOfMotion",
+    "WallGoResults": "results",
+    "getSafePathToResource": "utils",
+}
+
+# Helpers that need the WallGoCollision extension module
+_collisionAttributes: dict[str, str] = {
+    "dictToCollisionParameters": "collisionHelpers",
+    "convertParticleStatistics": "collisionHelpers",
+    "generateCollisionParticle": "collisionHelpers",
+    "generateCollisionModelDefinition": "collisionHelpers",
+}
+
+# list of submodules for lazy importing. collisionHelpers is only available
+# together with the WallGoCollision module, see _collisionAttributes
+submodules = [
+    "PotentialTools",
+    "boltzmann",
+    "collisionArray",
+    "config",
+    "containers",
+    "effectivePotential",
+    "equationOfMotion",
+    "exceptions",
+    "fields",
+    "freeEnergy",
+    "genericModel",
+    "grid",
+    "grid3Scales",
+    "helpers",
+    "hydrodynamics",
+    "hydrodynamicsTemplateModel",
+    "interpolatableFunction",
+    "manager",
+    "mathematicaHelpers",
+    "particle",
+    "polynomial",
+    "results",
+    "thermodynamics",
+    "utils",
+]
+
+if typing.TYPE_CHECKING:
+    # Eager imports for static type checkers and IDEs only
+    from .boltzmann import BoltzmannSolver
+    from .config import Config
+    from .collisionArray import CollisionArray
+    from .containers import PhaseInfo, BoltzmannBackground, BoltzmannDeltas, WallParams
+    from .effectivePotential import EffectivePotential, VeffDerivativeSettings
+    from .exceptions import WallGoError, WallGoPhaseValidationError, CollisionLoadError
+    from .fields import Fields
+    from .freeEnergy import FreeEnergy
+    from .genericModel import GenericModel
+    from .grid import Grid
+    from .grid3Scales import Grid3Scales
+    from .hydrodynamics import Hydrodynamics
+    from .hydrodynamicsTemplateModel import HydrodynamicsTemplateModel
+    from .interpolatableFunction import InterpolatableFunction, EExtrapolationType
+    from .manager import WallGoManager, WallSolverSettings
+    from .particle import Particle
+    from .polynomial import Polynomial
+    from .thermodynamics import Thermodynamics
+    from .equationOfMotion import EOM
+    from .results import WallGoResults
+    from .utils import getSafePathToResource
+
+
+def __getattr__(name: str) -> typing.Any:  # pylint: disable=invalid-name
+    """Lazy import of package level names and submodules, following Numpy and Scipy"""
+    if name in _lazyAttributes or (
+        name in _collisionAttributes and isCollisionModuleAvailable()
+    ):
+        moduleName = _lazyAttributes.get(name) or _collisionAttributes[name]
+        module = importlib.import_module(f"WallGo.{moduleName}")
+        value = getattr(module, name)
+        # Cache in the package namespace so that later lookups are direct
+        globals()[name] = value
+        return value
+
+    if name in submodules or (
+        name == "collisionHelpers" and isCollisionModuleAvailable()
+    ):
+        return importlib.import_module(f"WallGo.{name}")
+
+    raise AttributeError(f"Module 'WallGo' has no attribute '{name}'")
+
+
+def __dir__() -> list[str]:  # pylint: disable=invalid-name
+    """Lists also the lazily imported names"""
+    return sorted(set(globals()) | set(__all__) | set(submodules))
 
 
 global _bCollisionModuleAvailable  # pylint: disable=invalid-name
-_bCollisionModuleAvailable: bool = False
-
-try:
-    import WallGoCollision
-
-    #print(f"Loaded WallGoCollision package from location: {WallGoCollision.__path__}")
-    _bCollisionModuleAvailable = True  # pylint: disable=invalid-name
-
-    from .collisionHelpers import *
-
-except ImportError as e:
-    warnings.warn(f"Error loading WallGoCollision module: {e}"
-        "This could indicate an issue with your installation of WallGo or "
-        "WallGoCollision, or both. This is non-fatal, but you will not be able to"
-        " utilize collision integration routines."
-    )
+_bCollisionModuleAvailable: bool | None = None
+"""None until loading the WallGoCollision module has been attempted"""
 
 
 def isCollisionModuleAvailable() -> bool:
@@ -68,6 +140,23 @@ def isCollisionModuleAvailable() -> bool:
     availability at runtime if you must operate in an environment where the module may
     not always be available.
     """
+    global _bCollisionModuleAvailable  # pylint: disable=invalid-name
+
+    if _bCollisionModuleAvailable is None:
+        try:
+            import WallGoCollision  # pylint: disable=import-outside-toplevel, unused-import
+
+            #print(f"Loaded WallGoCollision package from location: {WallGoCollision.__path__}")
+            _bCollisionModuleAvailable = True
+
+        except ImportError as e:
+            warnings.warn(f"Error loading WallGoCollision module: {e}"
+                "This could indicate an issue with your installation of WallGo or "
+                "WallGoCollision, or both. This is non-fatal, but you will not be able to"
+                " utilize collision integration routines."
+            )
+            _bCollisionModuleAvailable = False
+
     return _bCollisionModuleAvailable
 
 _bInitialized = False  # pylint: disable=invalid-name
@@ -79,11 +168,24 @@ _bInitialized = False  # pylint: disable=invalid-name
 def _initializeInternal() -> None:
     """
     WallGo initializer. This should be called as early as possible in your program.
+    Attempts to load the WallGoCollision module.
     """
 
     global _bInitialized  # pylint: disable=invalid-name
 
     if not _bInitialized:
+        isCollisionModuleAvailable()
         _bInitialized = True
     else:
         raise RuntimeWarning("Warning: Repeated call to WallGo._initializeInternal()")
+
+
+# Try loading WallGoCollision at import, so that a broken installation is reported
+# right away. Only the collision helpers themselves are imported lazily.
+isCollisionModuleAvailable()
+
+# Names exported by `from WallGo import *`. Star-imports resolve these through
+# __getattr__, so they import the corresponding modules.
+__all__ = list(_lazyAttributes) + ["isCollisionModuleAvailable"]
+if _bCollisionModuleAvailable:
+    __all__ += list(_collisionAttributes)
@@ -119,6 +119,13 @@ class ConfigThermodynamics:
     uses the initial step size algorithm of :py:mod:`scipy.integrate.solve_ivp`.
     """
 
+    phaseTracerMethod: str = "RK45"
+    """
+    ODE solver used by the phase tracer. Either 'RK45', 'RK23', 'DOP853' or the
+    implicit 'Radau', which is more efficient when the phase tracing becomes stiff
+    close to a spinodal point.
+    """
+
 @dataclass
 class ConfigBoltzmannSolver:
     """ Holds the config of the BoltzmannSolver class. """
@@ -282,6 +289,10 @@ class Config:
                         self.configThermodynamics.phaseTracerFirstStep = None
                     else:
                         raise
+            if 'phaseTracerMethod' in keys:
+                self.configThermodynamics.phaseTracerMethod = parser.get(
+                    "Thermodynamics", "phaseTracerMethod"
+                )
 
         # Read the BoltzmannSolver configs
         if 'BoltzmannSolver' in parser.sections():
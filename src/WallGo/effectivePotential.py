@@ -145,28 +145,28 @@ class EffectivePotential(ABC):
         resValue = np.empty_like(T)
         resLocation = np.empty_like(guesses)
 
-        for i in range(0, numPoints):
+        """Numerically minimize the potential wrt. fields. 
+        We can pass a fields array to scipy routines normally, but scipy seems to forcibly convert back to standard ndarray
+        causing issues in the Veff evaluate function if it uses extended functionality from the Fields class. 
+        So we need a wrapper that casts back to Fields type. The temperature is passed through scipy's args,
+        so that the wrapper is defined once rather than for every point.
+        """
 
-            """Numerically minimize the potential wrt. fields. 
-            We can pass a fields array to scipy routines normally, but scipy seems to forcibly convert back to standard ndarray
-            causing issues in the Veff evaluate function if it uses extended functionality from the Fields class. 
-            So we need a wrapper that casts back to Fields type. It also needs to fix the temperature.
-            """
+        def evaluateWrapper(fieldArray: np.ndarray, temperature: float):
+            fields = Fields.castFromNumpy(fieldArray)
+            return self.evaluate(fields, temperature)
 
-            def evaluateWrapper(fieldArray: np.ndarray):
-                fields = Fields.castFromNumpy(fieldArray)
-                return self.evaluate(fields, T[i])
+        for i in range(0, numPoints):
 
             guess = guesses.getFieldPoint(i)
 
-            res = scipy.optimize.minimize(evaluateWrapper, guess, tol=tol)
+            res = scipy.optimize.minimize(evaluateWrapper, guess, args=(T[i],), tol=tol)
 
+            # res.fun is Veff evaluated at res.x, so any imaginary parts at the
+            # minimum have already been checked for by evaluate() there
             resLocation[i] = res.x
             resValue[i] = res.fun
 
-            # Check for presenece of imaginary parts at minimum
-            self.evaluate(Fields((res.x)), T[i])
-
         ## Need to cast the field location
         return Fields.castFromNumpy(resLocation), resValue
     
@@ -174,7 +174,8 @@ class EffectivePotential(ABC):
         """
         Calls self.evaluate from a single array X that contains both the fields and temperature.
         """
-        fields = Fields(X[...,:-1])
+        # Zero-copy view as Fields. Fields(...) would stack the points into a new array
+        fields = Fields.castFromNumpy(X[...,:-1])
         temperature = X[...,-1]
         return self.evaluate(fields, temperature)
     
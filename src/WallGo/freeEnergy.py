@@ -3,10 +3,12 @@ Class that does phase tracing, computes the effective potential in the minimum a
 interpolate it.
 """
 from dataclasses import dataclass
+from bisect import bisect_right
 import logging
 import numpy as np
 import scipy.integrate as scipyint
 import scipy.linalg as scipylinalg
+from scipy.interpolate import PPoly
 
 from .interpolatableFunction import (
     InterpolatableFunction,
@@ -17,6 +19,7 @@ from .interpolatableFunction import (
 from .effectivePotential import EffectivePotential
 from .exceptions import WallGoError
 from .fields import FieldPoint, Fields
+from .helpers import minEigenvalueSym
 
 
 @dataclass
@@ -56,6 +59,9 @@ class FreeEnergy(InterpolatableFunction):
     By definition: free energy density of a phase == value of Veff in its local minimum.
     """
 
+    PHASE_TRACER_METHODS: tuple[str, ...] = ("RK45", "RK23", "DOP853", "Radau")
+    """ODE solvers of scipy.integrate that can be used in tracePhase."""
+
     def __init__(
         self,
         effectivePotential: EffectivePotential,
@@ -81,6 +87,10 @@ class FreeEnergy(InterpolatableFunction):
 
         """
 
+        # Tabulated Veff used by evaluateVeff(), filled in by _interpolate()
+        self._veffBreakpoints: list[float] = []
+        self._veffCoefficients: list[list[list[float]]] = []
+
         adaptiveInterpolation = True
         # Set return value count.
         # Currently the InterpolatableFunction requires this to be set manually:
@@ -204,6 +214,75 @@ class FreeEnergy(InterpolatableFunction):
         # This is now a 2D array where rows are [f1, f2, ..., Veff]
         return np.asarray(result)
 
+    def _interpolate(self, x: inputType, fx: outputType) -> None:
+        """
+        Override of InterpolatableFunction._interpolate(). Additionally stores the
+        piecewise polynomials of the Veff column alone and of its first two
+        derivatives, which are used by evaluateVeff().
+        """
+        super()._interpolate(x, fx)
+
+        # The spline of each column is independent, so this is the same polynomial
+        # as the last column of the full spline
+        spline = self._interpolatedFunction
+        veffSpline = PPoly(spline.c[..., -1], spline.x, extrapolate=spline.extrapolate)
+
+        # Stored as Python lists: evaluateVeff is called with scalars in tight loops,
+        # where the call overhead of PPoly is much larger than the evaluation itself.
+        # _veffCoefficients[order][i] are the coefficients on the interval i, highest
+        # power first.
+        self._veffBreakpoints = veffSpline.x.tolist()
+        self._veffCoefficients = [
+            veffSpline.c.T.tolist(),
+            veffSpline.derivative(1).c.T.tolist(),
+            veffSpline.derivative(2).c.T.tolist(),
+        ]
+
+    def evaluateVeff(self, temperature: float, order: int = 0) -> float:
+        """
+        Value of the effective potential in the minimum, or its temperature
+        derivative of the given order, at a single temperature.
+
+        Equivalent to ``self(temperature).veffValue`` for order=0 and to
+        ``self.derivative(temperature, order).veffValue`` otherwise, but much
+        cheaper inside the interpolation range, where it only evaluates the
+        tabulated polynomial of the Veff column and does not build the minimum's
+        Fields. This is what Thermodynamics uses in its root finding loops.
+
+        Parameters
+        ----------
+        temperature : float
+            Temperature at which Veff is evaluated.
+        order : int, optional
+            Order of the temperature derivative. The default is 0.
+
+        Returns
+        -------
+        float
+            Veff in the minimum, or its derivative.
+        """
+        # The guard is ordered so that the common case, a float inside the
+        # interpolation range, is settled with as few checks as possible
+        breakpoints = self._veffBreakpoints
+        if (
+            order <= 2
+            and breakpoints
+            and (isinstance(temperature, float) or np.ndim(temperature) == 0)
+            and breakpoints[0] <= float(temperature) <= breakpoints[-1]
+        ):
+            temperature = float(temperature)
+            interval = min(bisect_right(breakpoints, temperature), len(breakpoints) - 1)
+            dT = temperature - breakpoints[interval - 1]
+            # Horner's scheme
+            result = 0.0
+            for coefficient in self._veffCoefficients[order][interval - 1]:
+                result = result * dT + coefficient
+            return result
+
+        if order == 0:
+            return self(temperature).veffValue
+        return self.derivative(temperature, order=order).veffValue
+
     def derivative(
         self, x: inputType, order: int = 1, bUseInterpolation: bool = True
     ) -> "FreeEnergyValueType":
@@ -246,6 +325,7 @@ class FreeEnergy(InterpolatableFunction):
         spinodal: bool = True,  # Stop tracing if a mass squared turns negative
         paranoid: bool = True,  # Re-solve minimum after every step
         phaseTracerFirstStep: float | None = None,  # Starting step
+        phaseTracerMethod: str = "RK45",  # ODE integrator
     ) -> None:
         r"""Traces minimum of potential
 
@@ -255,7 +335,7 @@ class FreeEnergy(InterpolatableFunction):
         .. math::
             \frac{\partial^2 V^\text{eff}}{\partial \phi_i \partial \phi_j}\bigg|_{\phi=\phi^\text{min}} \frac{\partial \phi^\text{min}_j}{\partial T} + \frac{\partial^2 V^\text{eff}}{\partial \phi_i \partial T}\bigg|_{\phi=\phi^\text{min}} = 0,
         
-        starting from a solution at the starting temperature. It uses `scipy.integrate.solve_ivp` to solve the problem. Stops if a mass squared goes through zero.
+        starting from a solution at the starting temperature. It uses the ODE solvers of `scipy.integrate` to solve the problem. Stops if a mass squared goes through zero.
 
         Parameters
         ----------
@@ -273,7 +353,22 @@ class FreeEnergy(InterpolatableFunction):
             If True, re-solve minimum after every step. The default is True.
         phaseTracerFirstStep : float or None, optional
             If a float, this gives the starting step size in units of the maximum step size :py:data:`dT`. If :py:data:`None` then uses the initial step size algorithm of :py:mod:`scipy.integrate.solve_ivp`. Default is :py:data:`None`
+        phaseTracerMethod : str, optional
+            ODE solver of :py:mod:`scipy.integrate` used for the tracing. Either one of
+            the explicit Runge-Kutta methods 'RK45', 'RK23' and 'DOP853', or the
+            implicit method 'Radau', which takes far fewer steps when the problem
+            becomes stiff close to a spinodal point. The Jacobian needed by 'Radau'
+            involves third derivatives of the potential and is estimated by finite
+            differences of the ODE. The default is 'RK45'.
         """
+        if phaseTracerMethod not in self.PHASE_TRACER_METHODS:
+            # Multistep methods like 'BDF' or 'LSODA' keep an internal history of the
+            # solution, which would be invalidated by the paranoid re-solving below.
+            raise ValueError(
+                f"Unknown phaseTracerMethod {phaseTracerMethod}, "
+                f"must be one of {self.PHASE_TRACER_METHODS}."
+            )
+
         # make sure the initial conditions are extra accurate
         extraTol = 0.01 * rTol
 
@@ -314,8 +409,7 @@ class FreeEnergy(InterpolatableFunction):
                 return 1.0  # don't bother testing
             # tests for if an eigenvalue of V'' goes through zero
             d2V = self.effectivePotential.deriv2Field2(FieldPoint(field), temperature)
-            eigs = scipylinalg.eigvalsh(d2V)
-            return float(min(eigs))
+            return minEigenvalueSym(d2V)
 
         # arrays to store results
         TList = np.full(1, T0)
@@ -338,7 +432,7 @@ class FreeEnergy(InterpolatableFunction):
         endpoints = [TMax, TMin]
         for direction in [0, 1]:
             TEnd = endpoints[direction]
-            ode = scipyint.RK45(
+            ode = getattr(scipyint, phaseTracerMethod)(
                 odeFunction,
                 T0,
                 phase0,
@@ -180,7 +180,7 @@ def derivative(
     coeffShapeLength = len(coeff.shape)
     return np.asarray(np.sum(
         coeff.reshape(coeff.shape + (fxShapeLength - coeffShapeLength) * (1,))
-        * f(pos, *args),
+        * fx,
         axis=0,
     ))
 
@@ -440,6 +440,21 @@ def boostVelocity(xi: float, v: float) -> float:
     return (xi - v) / (1.0 - xi * v)
 
 
+def minEigenvalueSym(matrix: np.ndarray) -> float:
+    """
+    Smallest eigenvalue of a real symmetric matrix. Uses closed-form expressions for
+    1x1 and 2x2 matrices, which avoids the LAPACK call overhead for small matrices.
+    """
+    matrix = np.asarray(matrix)
+    if matrix.shape == (1, 1):
+        return float(matrix[0, 0])
+    if matrix.shape == (2, 2):
+        halfTrace = 0.5 * (matrix[0, 0] + matrix[1, 1])
+        halfDiff = 0.5 * (matrix[0, 0] - matrix[1, 1])
+        return float(halfTrace - np.hypot(halfDiff, matrix[0, 1]))
+    return float(np.linalg.eigvalsh(matrix)[0])
+
+
 def nextStepDeton(
     pos1: float,
     pos2: float,
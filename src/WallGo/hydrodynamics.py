@@ -3,7 +3,9 @@ Classes for solving the hydrodynamic equations for the fluid velocity and temper
 """
 
 from typing import Tuple
+from collections import OrderedDict
 import logging
+import math
 import numpy as np
 import numpy.typing as npt
 from scipy.optimize import root_scalar, root, minimize_scalar
@@ -65,6 +67,18 @@ class Hydrodynamics:
 
         self.rtol, self.atol = rtol, atol
 
+        # Template model guesses of matchDeflagOrHyb, keyed on (vw, vp)
+        self._templateGuessCache: OrderedDict[tuple, list[float]] = OrderedDict()
+
+        # The high-temperature phase in front of a detonation is at Tnucl, so these
+        # enter every detonation matching and are computed only once
+        self._pHighTnucl, self._eHighTnucl = self._pressureAndEnergyHighT(self.Tnucl)
+        self._wHighTnucl = self._pHighTnucl + self._eHighTnucl
+
+        # For a bag-like equation of state the sound speed in front of the wall is
+        # constant, and the shock integration does not need to interpolate it
+        self._csqHighTConstant = self._findConstantCsqHighT()
+
         self.template = HydrodynamicsTemplateModel(thermodynamics, rtol=rtol, atol=atol)
 
         try:
@@ -100,20 +114,23 @@ class Hydrodynamics:
             The value of the Jouguet velocity for this model.
 
         """
-        pHighT = self.thermodynamics.pHighT(self.Tnucl)
-        eHighT = self.thermodynamics.eHighT(self.Tnucl)
+        pHighT, eHighT = self._pHighTnucl, self._eHighTnucl
+        # Bound methods of the objective, looked up once instead of at every call
+        pLowTFunction = self.thermodynamics.pLowT
+        dpLowTFunction = self.thermodynamics.dpLowT
+        ddpLowTFunction = self.thermodynamics.ddpLowT
 
         def vpDerivNum(tm: float) -> float:  # The numerator of the derivative of v+^2
-            pLowT = self.thermodynamics.pLowT(tm)
-            eLowT = self.thermodynamics.eLowT(tm)
+            # Each interpolated derivative of p is only evaluated once
+            pLowT = pLowTFunction(tm)
+            dpLowT = dpLowTFunction(tm)
+            eLowT = tm * dpLowT - pLowT
             num1 = pHighT - pLowT  # First factor in the numerator of v+^2
             num2 = pHighT + eLowT
             den1 = eHighT - eLowT  # First factor in the denominator of v+^2
             den2 = eHighT + pLowT
-            dnum1 = -self.thermodynamics.dpLowT(
-                tm
-            )  # T-derivative of first factor wrt tm
-            dnum2 = self.thermodynamics.deLowT(tm)
+            dnum1 = -dpLowT  # T-derivative of first factor wrt tm
+            dnum2 = tm * ddpLowTFunction(tm)
             dden1 = -dnum2  # T-derivative of second factor wrt tm
             dden2 = -dnum1
             return (
@@ -131,17 +148,18 @@ class Hydrodynamics:
 
         bracket1, bracket2 = vpDerivNum(Tmin), vpDerivNum(Tmax)
         while bracket1 * bracket2 > 0 and Tmax < self.TMaxHydro:
-            Tmin = Tmax
-            Tmax = min(Tmax + self.Tnucl, self.TMaxHydro)
-            bracket1, bracket2 = vpDerivNum(Tmin), vpDerivNum(Tmax)
+            # Grow the interval geometrically, reusing the value at the old Tmax
+            Tmin, bracket1 = Tmax, bracket2
+            Tmax = min(1.5 * Tmax, self.TMaxHydro)
+            bracket2 = vpDerivNum(Tmax)
 
         tmSol: float
         if bracket1 * bracket2 <= 0:
-            # If Tmin and Tmax bracket our root, use the 'brentq' method.
+            # If Tmin and Tmax bracket our root, use the 'toms748' method.
             rootResult = root_scalar(
                 vpDerivNum,
-                bracket=[self.Tnucl, Tmax],
-                method="brentq",
+                bracket=[Tmin, Tmax],
+                method="toms748",
                 xtol=self.atol,
                 rtol=self.rtol,
             )
@@ -165,11 +183,9 @@ class Hydrodynamics:
                 data={"flag": rootResult.flag, "Root result": rootResult},
             )
 
+        pLowT, eLowT = self._pressureAndEnergyLowT(tmSol)
         vp = np.sqrt(
-            (pHighT - self.thermodynamics.pLowT(tmSol))
-            * (pHighT + self.thermodynamics.eLowT(tmSol))
-            / (eHighT - self.thermodynamics.eLowT(tmSol))
-            / (eHighT + self.thermodynamics.pLowT(tmSol))
+            (pHighT - pLowT) * (pHighT + eLowT) / (eHighT - eLowT) / (eHighT + pLowT)
         )
         return float(vp)
 
@@ -187,14 +203,18 @@ class Hydrodynamics:
 
         """
 
+        # The matchings are expensive, and the root finds for Tm and Tp below share
+        # their bracket endpoints, so they are memoised by wall velocity
+        TpTmCache: dict[float, list[float]] = {}
+
         def TpTm(vw: float) -> list[float]:
-            _, _, Tp, Tm = self.findMatching(vw)
-            return [Tp, Tm]
+            if vw not in TpTmCache:
+                _, _, Tp, Tm = self.findMatching(vw)
+                TpTmCache[vw] = [Tp, Tm]
+            return TpTmCache[vw]
 
-        if (
-            TpTm(self.vJ - self.vBracketLow)[1] < self.TMaxLowT
-            and TpTm(self.vJ - self.vBracketLow)[0] < self.TMaxHighT
-        ):
+        TpEdge, TmEdge = TpTm(self.vJ - self.vBracketLow)
+        if TmEdge < self.TMaxLowT and TpEdge < self.TMaxHighT:
             return self.vJ
 
         def TmMax(vw: float) -> float:
@@ -204,7 +224,7 @@ class Hydrodynamics:
             vmax1 = root_scalar(
                 TmMax,
                 bracket=[self.vMin + self.vBracketLow, self.vJ - self.vBracketLow],
-                method="brentq",
+                method="brenth",
                 xtol=self.atol,
                 rtol=self.rtol,
             ).root
@@ -223,7 +243,7 @@ class Hydrodynamics:
             vmax2 = root_scalar(
                 TpMax,
                 bracket=[self.vMin + self.vBracketLow, self.vJ - self.vBracketLow],
-                method="brentq",
+                method="brenth",
                 xtol=self.atol,
                 rtol=self.rtol,
             ).root
@@ -250,9 +270,14 @@ class Hydrodynamics:
             The value of the slowest detonation solution for this model
         """
 
+        # Memoised, as vw = 1 is evaluated both here and as a bracket endpoint below
+        TpTmCache: dict[float, list[float]] = {}
+
         def TpTm(vw: float) -> list[float]:
-            _, _, Tp, Tm = self.findMatching(vw)
-            return [Tp, Tm]
+            if vw not in TpTmCache:
+                _, _, Tp, Tm = self.findMatching(vw)
+                TpTmCache[vw] = [Tp, Tm]
+            return TpTmCache[vw]
 
         if TpTm(1)[1] > self.TMaxLowT:
             return 1
@@ -264,7 +289,7 @@ class Hydrodynamics:
             vmin = root_scalar(
                 TmMax,
                 bracket=[self.vJ + 1e-4, 1],
-                method="brentq",
+                method="brenth",
                 xtol=self.atol,
                 rtol=self.rtol,
             ).root
@@ -292,8 +317,8 @@ class Hydrodynamics:
             `v_+v_-` and :math:`v_+/v_-`
         """
 
-        pHighT, pLowT = self.thermodynamics.pHighT(Tp), self.thermodynamics.pLowT(Tm)
-        eHighT, eLowT = self.thermodynamics.eHighT(Tp), self.thermodynamics.eLowT(Tm)
+        pHighT, eHighT = self._pressureAndEnergyHighT(Tp)
+        pLowT, eLowT = self._pressureAndEnergyLowT(Tm)
         vpvm = (
             (pHighT - pLowT) / (eHighT - eLowT)
             if eHighT != eLowT
@@ -321,38 +346,52 @@ class Hydrodynamics:
         """
         vp = vw
         Tp = self.Tnucl
-        pHighT, wHighT = self.thermodynamics.pHighT(Tp), self.thermodynamics.wHighT(Tp)
-        eHighT = wHighT - pHighT
+        pHighT, eHighT = self._pHighTnucl, self._eHighTnucl
+        pressureAndEnergyLowT = self._pressureAndEnergyLowT
+        vpsq = vp**2
 
         def tmFromvpsq(tm: float) -> float:
-            pLowT, wLowT = self.thermodynamics.pLowT(tm), self.thermodynamics.wLowT(tm)
-            eLowT = wLowT - pLowT
+            pLowT, eLowT = pressureAndEnergyLowT(tm)
             return float(
-                vp**2 * (eHighT - eLowT)
+                vpsq * (eHighT - eLowT)
                 - (pHighT - pLowT) * (eLowT + pHighT) / (eHighT + pLowT)
             )
 
-        minimizeResult = minimize_scalar(
-            tmFromvpsq,
-            bounds=[self.Tnucl, self.TMaxHydro],
-            method="Bounded",
-        )
+        # tmFromvpsq is positive at Tnucl and the solution is where it first turns
+        # negative. A coarse scan usually brackets it, which is much cheaper than
+        # locating the minimum of tmFromvpsq.
+        TGrid = np.linspace(self.Tnucl, self.TMaxHydro, 12)
+        values = np.array([tmFromvpsq(T) for T in TGrid])
+        signChanges = np.flatnonzero(np.sign(values[:-1]) != np.sign(values[1:]))
 
-        if minimizeResult.success:
-            Tmax = minimizeResult.x
+        if values[0] >= 0 and signChanges.size > 0:
+            bracket = [TGrid[signChanges[0]], TGrid[signChanges[0] + 1]]
         else:
-            raise WallGoError(minimizeResult.message, minimizeResult)
-        if minimizeResult.fun > 0:
-            raise WallGoError(
-                "No solutions to the matching equations were found. This can be "
-                "caused by a bad interpolation of the free energy. Try decreasing "
-                "phaseTracerTol.",
-                minimizeResult,
+            # The region where tmFromvpsq < 0 can be narrower than the grid spacing,
+            # so we bracket the root with the minimum instead
+            minimizeResult = minimize_scalar(
+                tmFromvpsq,
+                bounds=[self.Tnucl, self.TMaxHydro],
+                method="Bounded",
             )
+
+            if minimizeResult.success:
+                Tmax = minimizeResult.x
+            else:
+                raise WallGoError(minimizeResult.message, minimizeResult)
+            if minimizeResult.fun > 0:
+                raise WallGoError(
+                    "No solutions to the matching equations were found. This can be "
+                    "caused by a bad interpolation of the free energy. Try decreasing "
+                    "phaseTracerTol.",
+                    minimizeResult,
+                )
+            bracket = [self.Tnucl, Tmax]
+
         rootResult = root_scalar(
             tmFromvpsq,
-            bracket=[self.Tnucl, Tmax],
-            method="brentq",
+            bracket=bracket,
+            method="brenth",
             xtol=self.atol,
             rtol=self.rtol,
         )
@@ -367,7 +406,10 @@ class Hydrodynamics:
         return (vp, vm, Tp, Tm)
 
     def matchDeflagOrHyb(
-        self, vw: float, vp: float | None = None
+        self,
+        vw: float,
+        vp: float | None = None,
+        initialGuess: list[float] | None = None,
     ) -> Tuple[float, float, float, float]:
         r"""
         Obtains the matching parameters :math:`v_+, v_-, T_+, T_-` for a deflagration
@@ -380,6 +422,10 @@ class Hydrodynamics:
         vp : float or None, optional
             Plasma velocity in front of the wall :math:`v_+`. If None, vp is
             determined from conservation of entropy. Default is None.
+        initialGuess : list[float] or None, optional
+            Starting point [Tp, Tm] for the solver, e.g. the solution at a nearby
+            vp. If the solver does not converge from it, the template model guess
+            is used instead. Default is None.
 
         Returns
         -------
@@ -389,81 +435,83 @@ class Hydrodynamics:
 
         """
 
+        # Sound speeds evaluated by the solver, so that the one at the solution does
+        # not have to be recomputed after the root finding
+        csqLowTCache: dict[float, float] = {}
+
+        def csqLowT(tm: float) -> float:
+            if tm not in csqLowTCache:
+                csqLowTCache[tm] = self.thermodynamics.csqLowT(tm)
+            return csqLowTCache[tm]
+
+        # Bound methods and constants of the residual, looked up once. The inverse
+        # of _mappingT is inlined.
+        atan = math.atan
+        mappingScale = (self.TMaxHydro - self.TMinHydro) / math.pi
+        mappingCenter = (self.TMaxHydro + self.TMinHydro) / 2
+        vpvmAndvpovm = self.vpvmAndvpovm
+        vwsq = vw**2
+        vpsqFixed = None if vp is None else vp**2
+
         def matching(
-            mappedTpTm: list[float],
+            mappedTpTm: list[float], invTp0: float, invTm0: float
         ) -> Tuple[float, float]:  # Matching relations at the wall interface
-            Tpm = self._inverseMappingT(mappedTpTm)
-            vmsq = min(vw**2, self.thermodynamics.csqLowT(Tpm[1]))
+            Tp = atan(mappedTpTm[0]) * mappingScale + mappingCenter
+            Tm = atan(mappedTpTm[1]) * mappingScale + mappingCenter
+            vmsq = min(vwsq, csqLowT(Tm))
 
-            if vp is None:
+            if vpsqFixed is None:
                 # Determine vp from entropy conservation, e.g. eq. (15) of 2303.10171
-                vpsq = (Tpm[1] ** 2 - Tpm[0] ** 2 * (1 - vmsq)) / Tpm[1] ** 2
+                vpsq = 1 - (Tp / Tm) ** 2 * (1 - vmsq)
             else:
-                vpsq = vp**2
-            vpvm, vpovm = self.vpvmAndvpovm(Tpm[0], Tpm[1])
+                vpsq = vpsqFixed
+            vpvm, vpovm = vpvmAndvpovm(Tp, Tm)
             eq1 = vpvm * vpovm - vpsq
             eq2 = vpvm / vpovm - vmsq
 
             # We multiply the equations by c to make sure the solver
             # does not explore arbitrarly small or large values of Tm and Tp.
-            c = (2**2 + (Tpm[0] / Tpm0[0]) ** 2 + (Tpm[1] / Tpm0[1]) ** 2) * (
-                2**2 + (Tpm0[0] / Tpm[0]) ** 2 + (Tpm0[1] / Tpm[1]) ** 2
-            )
+            # invTp0 and invTm0 are the inverse of the initial guess.
+            rpSq = (Tp * invTp0) ** 2
+            rmSq = (Tm * invTm0) ** 2
+            c = (4 + rpSq + rmSq) * (4 + 1 / rpSq + 1 / rmSq)
             return (eq1 * c, eq2 * c)
 
-        # Finds an initial guess for Tp and Tm using the template model and make
-        # sure it satisfies all the relevant bounds.
-        try:
-            if vw > self.template.vMin:
-                vwTemplate = min(vw, self.template.vJ - 1e-6)
-                vpTemplate = vp
-                if vp is not None:
-                    vpTemplate = min(vp, vwTemplate)
-                Tpm0 = self.template.matchDeflagOrHybInitial(vwTemplate, vpTemplate)
-            else:
-                Tpm0 = [self.Tnucl, 0.99 * self.Tnucl]
-        except WallGoError:
-            Tpm0 = [
-                min(1.1, 1 / np.sqrt(1 - min(vw**2, self.template.cb2))) * self.Tnucl,
-                self.Tnucl,
-            ]  # The temperature in front of the wall Tp will be above Tnucl,
-            # so we use the smallest of 1.1*Tnucl or gamma_-*Tnucl as initial guess
-            # (the latter being close to the LTE value of (gamma_-/gamma_+)*T_-).
-
-        if np.any(np.isnan(Tpm0)):
-            Tpm0 = [
-                min(1.1, 1 / np.sqrt(1 - min(vw**2, self.template.cb2))) * self.Tnucl,
-                self.Tnucl,
-            ]
-        if (vp is not None) and (Tpm0[0] <= Tpm0[1]):
-            Tpm0[0] = 1.01 * Tpm0[1]
-        if (vp is None) and (
-            Tpm0[0] <= Tpm0[1]
-            or Tpm0[0]
-            > Tpm0[1] / np.sqrt(1 - min(vw**2, self.thermodynamics.csqLowT(Tpm0[1])))
-        ):
-            Tpm0[0] = (
-                Tpm0[1]
-                * (
-                    1
-                    + 1 / np.sqrt(1 - min(vw**2, self.thermodynamics.csqLowT(Tpm0[1])))
-                )
-                / 2
+        # A solution at nearby velocities is a much better starting point for the
+        # solver than the template model guess. It is only kept if the solver
+        # converged properly.
+        sol = None
+        if initialGuess is not None and initialGuess[0] > 0 and initialGuess[1] > 0:
+            Tpm0 = list(initialGuess)
+            sol = root(
+                matching,
+                self._mappingT(Tpm0),
+                args=tuple(1 / np.asarray(Tpm0)),
+                method="hybr",
+                options={"xtol": self.atol},
+            )
+            if not sol.success:
+                sol = None
+
+        if sol is None:
+            Tpm0 = self._initialGuessDeflagOrHyb(vw, vp)
+            # We map Tm and Tp, which we assume to lie between TMinHydro and
+            # TMaxHydro, to the interval (-inf,inf) which is used by the solver.
+            sol = root(
+                matching,
+                self._mappingT(Tpm0),
+                args=tuple(1 / np.asarray(Tpm0)),
+                method="hybr",
+                options={"xtol": self.atol},
             )
-
-        # We map Tm and Tp, which we assume to lie between TMinHydro and TMaxHydro,
-        # to the interval (-inf,inf) which is used by the solver.
-        sol = root(
-            matching, self._mappingT(Tpm0), method="hybr", options={"xtol": self.atol}
-        )
         self.success = (
             sol.success or np.sum(sol.fun**2) < 1e-6
         )  # If the error is small enough,
         # we consider that root has converged even if it returns False.
         [Tp, Tm] = self._inverseMappingT(sol.x)
 
-        vmsq = min(vw**2, self.thermodynamics.csqLowT(Tm))
-        vm = np.sqrt(max(vmsq, 0))
+        vmsq = min(vw**2, csqLowT(Tm))
+        vm = math.sqrt(max(vmsq, 0))
         if vp is None:
             vp = np.sqrt((Tm**2 - Tp**2 * (1 - vm**2))) / Tm
 
@@ -483,6 +531,62 @@ class Hydrodynamics:
             )
         return vp, vm, Tp, Tm
 
+    def _initialGuessDeflagOrHyb(self, vw: float, vp: float | None) -> list[float]:
+        """
+        Finds an initial guess [Tp, Tm] for the solver in matchDeflagOrHyb using the
+        template model, and makes sure it satisfies all the relevant bounds.
+        """
+        try:
+            if vw > self.template.vMin:
+                vwTemplate = min(vw, self.template.vJ - 1e-6)
+                vpTemplate = vp
+                if vp is not None:
+                    vpTemplate = min(vp, vwTemplate)
+                Tpm0 = self._templateGuess(vwTemplate, vpTemplate)
+            else:
+                Tpm0 = [self.Tnucl, 0.99 * self.Tnucl]
+        except WallGoError:
+            Tpm0 = [
+                min(1.1, 1 / math.sqrt(1 - min(vw**2, self.template.cb2))) * self.Tnucl,
+                self.Tnucl,
+            ]  # The temperature in front of the wall Tp will be above Tnucl,
+            # so we use the smallest of 1.1*Tnucl or gamma_-*Tnucl as initial guess
+            # (the latter being close to the LTE value of (gamma_-/gamma_+)*T_-).
+
+        # Also catches NaN. The solver is scaled by the inverse guess, which
+        # requires positive temperatures
+        if not (Tpm0[0] > 0 and Tpm0[1] > 0):
+            Tpm0 = [
+                min(1.1, 1 / math.sqrt(1 - min(vw**2, self.template.cb2))) * self.Tnucl,
+                self.Tnucl,
+            ]
+        if (vp is not None) and (Tpm0[0] <= Tpm0[1]):
+            Tpm0[0] = 1.01 * Tpm0[1]
+        if vp is None:
+            gammaM = 1 / math.sqrt(1 - min(vw**2, self.thermodynamics.csqLowT(Tpm0[1])))
+            if Tpm0[0] <= Tpm0[1] or Tpm0[0] > Tpm0[1] * gammaM:
+                Tpm0[0] = Tpm0[1] * (1 + gammaM) / 2
+
+        return Tpm0
+
+    def _templateGuess(self, vw: float, vp: float | None) -> list[float]:
+        """
+        Returns the template model matching [Tp, Tm] at (vw, vp), keeping the most
+        recent results in a small cache. During the root finding of findMatching, vw
+        is fixed and the same vp are often visited again. The key is exact, so that
+        the guess only depends on (vw, vp) and not on earlier calls.
+        """
+        key = (vw, vp)
+        cache = self._templateGuessCache
+        if key in cache:
+            cache.move_to_end(key)
+        else:
+            cache[key] = list(self.template.matchDeflagOrHybInitial(vw, vp))
+            if len(cache) > 64:
+                cache.popitem(last=False)
+        # Return a copy, because the guess is adjusted in place by the caller
+        return list(cache[key])
+
     def shockDE(
         self, v: float, xiAndT: np.ndarray, shockWave: bool=True
     ) -> Tuple[npt.ArrayLike, npt.ArrayLike]:
@@ -508,7 +612,9 @@ class Hydrodynamics:
             The expressions for :math:`\frac{\partial \xi}{\partial v}`
             and :math:`\frac{\partial T}{\partial v}`
         """
-        xi, T = xiAndT
+        # Python floats are much faster than numpy scalars in the arithmetic below
+        xi, T = np.asarray(xiAndT, dtype=float).tolist()
+        v = float(v)
 
         if T <= 0:
             raise WallGoError(
@@ -519,18 +625,17 @@ class Hydrodynamics:
             )
 
         if shockWave:
-            csq = self.thermodynamics.csqHighT(T)
+            csq = self._csqHighTShock(T)
         else:
             csq = self.thermodynamics.csqLowT(T)
-        eq1 = (
-            gammaSq(v)
-            * (1.0 - v * xi)
-            * (boostVelocity(xi, v) ** 2 / csq - 1.0)
-            * xi
-            / 2.0
-            / v
-        )
-        eq2 = T * gammaSq(v) * boostVelocity(xi, v)
+        # This is the right-hand side integrated by solve_ivp, so the common
+        # factors are computed only once, and gammaSq(v) and boostVelocity(xi, v)
+        # are inlined
+        oneMinusXiV = 1.0 - xi * v
+        gammaSqV = 1.0 / (1.0 - v * v)
+        mu = (xi - v) / oneMinusXiV
+        eq1 = gammaSqV * oneMinusXiV * (mu * mu / csq - 1.0) * xi / (2.0 * v)
+        eq2 = T * gammaSqV * mu
         return [eq1, eq2]
 
     def solveHydroShock(self, vw: float, vp: float, Tp: float) -> float:
@@ -558,7 +663,7 @@ class Hydrodynamics:
 
         def shock(v: float, xiAndT: np.ndarray | list) -> float:
             xi, T = xiAndT
-            return float(boostVelocity(xi, v) * xi - self.thermodynamics.csqHighT(T))
+            return float(boostVelocity(xi, v) * xi - self._csqHighTShock(T))
 
         shock.terminal = True
         xi0T0 = [vw, Tp]
@@ -583,15 +688,15 @@ class Hydrodynamics:
             vmShock = solshock.t[-1]
             xiShock, TmShock = solshock.y[:, -1]
 
-        # continuity of the ii-compontent of the energy-momentum tensor
+        # continuity of the ii-compontent of the energy-momentum tensor. Only the
+        # enthalpy in front of the shock depends on tn, the rest is computed once.
+        vShock = boostVelocity(xiShock, vmShock)
+        TiiBehindShock = self.thermodynamics.wHighT(TmShock) * vShock * gammaSq(vShock)
+        xiFactorShock = xiShock / (1 - xiShock**2)
+        wHighT = self.thermodynamics.wHighT
+
         def TiiShock(tn: float) -> float:
-            return self.thermodynamics.wHighT(tn) * xiShock / (
-                1 - xiShock**2
-            ) - self.thermodynamics.wHighT(TmShock) * boostVelocity(
-                xiShock, vmShock
-            ) * gammaSq(
-                boostVelocity(xiShock, vmShock)
-            )
+            return wHighT(tn) * xiFactorShock - TiiBehindShock
 
         # Make an initial guess for the temperature range in which Tnucl will be found
         Tmin, Tmax = max(self.Tnucl / 2, self.TMinHydro), TmShock
@@ -605,11 +710,11 @@ class Hydrodynamics:
             bracket1 = TiiShock(Tmin)
 
         if bracket1 * bracket2 <= 0:
-            # If Tmin and Tmax bracket our root, use the 'brentq' method.
+            # If Tmin and Tmax bracket our root, use the 'brenth' method.
             TnRootResult = root_scalar(
                 TiiShock,
                 bracket=[Tmin, Tmax],
-                method="brentq",
+                method="brenth",
                 xtol=self.atol,
                 rtol=self.rtol,
             )
@@ -647,15 +752,18 @@ class Hydrodynamics:
 
         """
 
+        # The pressure behind the wall does not depend on Tp, so it is evaluated
+        # once outside of the root finding
+        pLowTMin = self.thermodynamics.pLowT(self.TMinHydro)
+
         def matchingStrongest(Tp: float) -> float:
-            return self.thermodynamics.pHighT(Tp) - self.thermodynamics.pLowT(
-                self.TMinHydro
-            )
+            return self.thermodynamics.pHighT(Tp) - pLowTMin
 
         try:
             TpStrongestRootResult = root_scalar(
                 matchingStrongest,
                 bracket=[self.TMinHydro, self.TMaxHydro],
+                method="brenth",
                 rtol=self.rtol,
                 xtol=self.atol,
             )
@@ -688,6 +796,7 @@ class Hydrodynamics:
             vMinRootResult = root_scalar(
                 strongestshockTnucl,
                 bracket=(self.vBracketLow, self.vJ),
+                method="brenth",
                 rtol=self.rtol,
                 xtol=self.atol,
             )
@@ -730,9 +839,33 @@ class Hydrodynamics:
             # here to save time. We will use Tp later if it doesn't work.
             vpmax = min(vwTry, self.thermodynamics.csqHighT(self.Tnucl) / vwTry)
 
+            # Once the root finders below close in on the solution, they visit
+            # nearby vp in turn. The matching at the previous vp is then used as
+            # the starting point of the next one. It is local to this call, so the
+            # result only depends on vwTry.
+            previous: tuple[float, list[float]] | None = None
+
+            def matching(vpTry: float) -> Tuple[float, float, float, float]:
+                nonlocal previous
+                initialGuess = None
+                if previous is not None and abs(vpTry - previous[0]) < 1e-2:
+                    initialGuess = previous[1]
+                result = self.matchDeflagOrHyb(vwTry, vpTry, initialGuess)
+                if self.success:
+                    previous = (vpTry, [result[2], result[3]])
+                return result
+
+            # Each evaluation solves the matching and integrates the shock. The root
+            # finders evaluate the bracket endpoints again, so results are memoised.
+            shockTnuclDiffCache: dict[float, float] = {}
+
             def shockTnuclDiff(vpTry: float) -> float:
-                _, _, Tp, _ = self.matchDeflagOrHyb(vwTry, vpTry)
-                return self.solveHydroShock(vwTry, vpTry, Tp) - self.Tnucl
+                if vpTry not in shockTnuclDiffCache:
+                    _, _, Tp, _ = matching(vpTry)
+                    shockTnuclDiffCache[vpTry] = (
+                        self.solveHydroShock(vwTry, vpTry, Tp) - self.Tnucl
+                    )
+                return shockTnuclDiffCache[vpTry]
 
             shockTnuclDiffMin = shockTnuclDiff(vpmin)
             shockTnuclDiffMax = shockTnuclDiff(vpmax)
@@ -743,13 +876,14 @@ class Hydrodynamics:
             if shockTnuclDiffMin * shockTnuclDiffMax > 0:
 
                 def solveVpmax(vpTry: float) -> float:
-                    _, _, Tp, _ = self.matchDeflagOrHyb(vwTry, vpTry)
+                    _, _, Tp, _ = matching(vpTry)
                     return vpTry - self.thermodynamics.csqHighT(Tp) / vwTry
 
                 if solveVpmax(vwTry) * solveVpmax(vpmax) <= 0:
                     vpmax = root_scalar(
                         solveVpmax,
                         bracket=[vpmax, vwTry],
+                        method="brenth",
                         xtol=self.atol,
                         rtol=self.rtol,
                     ).root
@@ -783,10 +917,11 @@ class Hydrodynamics:
                 sol = root_scalar(
                     shockTnuclDiff,
                     bracket=[vpmin, extremum.x],
+                    method="brenth",
                     xtol=self.atol,
                     rtol=self.rtol,
                 )
-            vp, vm, Tp, Tm = self.matchDeflagOrHyb(vwTry, sol.root)
+            vp, vm, Tp, Tm = matching(sol.root)
 
         return (vp, vm, Tp, Tm)
 
@@ -849,20 +984,47 @@ class Hydrodynamics:
             The value of the wall velocity for this model in local thermal equilibrium.
         """
 
-        # Function given to the root finder.
+        # The matching is needed by both functions below, often at the same vw, so
+        # it is memoised together with its success flag. The last converged
+        # matching of this call is the starting point of the next one if it was
+        # found at a nearby vw.
+        matchingCache: dict[float, tuple[Tuple[float, float, float, float], bool]] = {}
+        previous: tuple[float, list[float]] | None = None
+
+        def matching(vw: float) -> Tuple[float, float, float, float]:
+            nonlocal previous
+            if vw in matchingCache:
+                result, self.success = matchingCache[vw]
+            else:
+                initialGuess = None
+                if previous is not None and abs(vw - previous[0]) < 1e-2:
+                    initialGuess = previous[1]
+                result = self.matchDeflagOrHyb(vw, initialGuess=initialGuess)
+                matchingCache[vw] = (result, self.success)
+                if self.success:
+                    previous = (vw, [result[2], result[3]])
+            return result
+
+        # Function given to the root finder. The endpoints vmin and vmax are
+        # evaluated before the root finding, which evaluates them again, so the
+        # results are memoised.
+        shockTnuclDiffCache: dict[float, float] = {}
+
         def shockTnuclDiff(
             vw: float,
         ) -> float:
-            vp, _, Tp, _ = self.matchDeflagOrHyb(vw)
-            Tntry = self.solveHydroShock(vw, vp, Tp)
-            return Tntry - self.Tnucl
+            if vw not in shockTnuclDiffCache:
+                vp, _, Tp, _ = matching(vw)
+                Tntry = self.solveHydroShock(vw, vp, Tp)
+                shockTnuclDiffCache[vw] = Tntry - self.Tnucl
+            return shockTnuclDiffCache[vw]
 
         # Equation to find the position of the shock front.
         # If shock(vw) < 0, the front is ahead of vw.
         def shock(
             vw: float,
         ) -> float:
-            vp, _, Tp, _ = self.matchDeflagOrHyb(vw)
+            vp, _, Tp, _ = matching(vw)
             return vp * vw - self.thermodynamics.csqHighT(Tp)
 
         self.success = True
@@ -873,11 +1035,13 @@ class Hydrodynamics:
             shock(vmax) > 0
         ):  # Finds the maximum vw such that the shock front is ahead of the wall.
             try:
+                # The upper end of the bracket is vmax rather than vJ, so that the
+                # memoised matching at vmax is reused
                 vmax = root_scalar(
                     shock,
                     bracket=[
                         self.thermodynamics.csqHighT(self.Tnucl) ** 0.5,
-                        self.vJ,
+                        vmax,
                     ],
                     xtol=self.atol,
                     rtol=self.rtol,
@@ -932,7 +1096,7 @@ class Hydrodynamics:
         if vw < self.vJ:
             def shock(v: float, xiAndT: np.ndarray | list) -> float:
                 xi, T = xiAndT
-                return float(boostVelocity(xi, v)*xi - self.thermodynamics.csqHighT(T))
+                return float(boostVelocity(xi, v)*xi - self._csqHighTShock(T))
 
             shock.terminal = True
             xi0T0 = [vw, Tp]
@@ -956,7 +1120,7 @@ class Hydrodynamics:
                 kappaSW = 4 * simpson(
                     y=xi**2*vPlasma**2*gammaSq(vPlasma)*enthalpy,
                     x=xi
-                ) / (vw**3*self.thermodynamics.wHighT(self.Tnucl)*self.template.alN)
+                ) / (vw**3*self._wHighTnucl*self.template.alN)
 
         # If hybrid or detonation, computes the rarefaction wave contribution
         if vw**2 > self.thermodynamics.csqLowT(Tm):
@@ -980,16 +1144,64 @@ class Hydrodynamics:
             kappaRW = -4 * simpson(
                 y=xi**2*vPlasma**2*gammaSq(vPlasma)*enthalpy,
                 x=xi
-            ) / (vw**3*self.thermodynamics.wHighT(self.Tnucl)*self.template.alN)
+            ) / (vw**3*self._wHighTnucl*self.template.alN)
 
         return kappaSW + kappaRW
 
+    def _findConstantCsqHighT(self) -> float | None:
+        """
+        Returns the sound speed squared in the high-temperature phase if it takes the
+        same value at a few temperatures across the hydrodynamics range, as for the
+        bag or template equations of state, and None otherwise.
+        """
+        TMin = max(self.TMinHydro, self.TMinHighT)
+        TMax = min(self.TMaxHydro, self.TMaxHighT)
+        if not TMin < TMax:
+            return None
+
+        csq = np.array(
+            [self.thermodynamics.csqHighT(T) for T in np.linspace(TMin, TMax, 5)],
+            dtype=float,
+        )
+        if np.all(np.isfinite(csq)) and np.ptp(csq) <= 1e-12 * abs(csq[0]):
+            return float(csq[0])
+        return None
+
+    def _csqHighTShock(self, temperature: float) -> float:
+        """
+        Sound speed squared in the high-temperature phase, as used in the shock
+        integration. Avoids the interpolation if it is constant.
+        """
+        if self._csqHighTConstant is not None:
+            return self._csqHighTConstant
+        return float(self.thermodynamics.csqHighT(temperature))
+
+    def _pressureAndEnergyHighT(self, temperature: float) -> Tuple[float, float]:
+        r"""
+        Pressure and energy density in the high-temperature phase. Computing
+        :math:`e = T\frac{dp}{dT} - p` here from the same :math:`p` avoids
+        interpolating the pressure twice, as separate calls to pHighT and eHighT
+        would.
+        """
+        pHighT = self.thermodynamics.pHighT(temperature)
+        return pHighT, self.thermodynamics.wHighT(temperature) - pHighT
+
+    def _pressureAndEnergyLowT(self, temperature: float) -> Tuple[float, float]:
+        """
+        Pressure and energy density in the low-temperature phase, see
+        _pressureAndEnergyHighT.
+        """
+        pLowT = self.thermodynamics.pLowT(temperature)
+        return pLowT, self.thermodynamics.wLowT(temperature) - pLowT
+
     def _mappingT(self, TpTm: list[float]) -> list[float]:
         """
         Maps the variables Tp and Tm, which are constrained to
         TMinHydro < Tm,Tp < TMaxHydro to the interval (-inf,inf) to allow root
         finding algorithms to explore different values of (Tp,Tm), without going
-        outside of the bounds above.
+        outside of the bounds above. The mappings act on scalars, so they use the
+        math module and return Python floats rather than numpy scalars. The inverse
+        mapping is inlined in the residual of matchDeflagOrHyb.
 
         Parameters
         ----------
@@ -998,17 +1210,10 @@ class Hydrodynamics:
         """
 
         Tp, Tm = TpTm
-        mappedTm = np.tan(
-            np.pi
-            / (self.TMaxHydro - self.TMinHydro)
-            * (Tm - (self.TMaxHydro + self.TMinHydro) / 2)
-        )  # Maps Tm =TminGuess to -inf and Tm = TmaxGuess to inf
-        mappedTp = np.tan(
-            np.pi
-            / (self.TMaxHydro - self.TMinHydro)
-            * (Tp - (self.TMaxHydro + self.TMinHydro) / 2)
-        )  # Maps Tp=TminGuess to -inf and Tp =TmaxGuess to +inf
-        return [mappedTp, mappedTm]
+        # Maps T = TMinHydro to -inf and T = TMaxHydro to +inf
+        scale = math.pi / (self.TMaxHydro - self.TMinHydro)
+        center = (self.TMaxHydro + self.TMinHydro) / 2
+        return [math.tan(scale * (Tp - center)), math.tan(scale * (Tm - center))]
 
     def _inverseMappingT(self, mappedTpTm: list[float]) -> list[float]:
         """
@@ -1016,12 +1221,9 @@ class Hydrodynamics:
         """
 
         mappedTp, mappedTm = mappedTpTm
-        Tp = (
-            np.arctan(mappedTp) * (self.TMaxHydro - self.TMinHydro) / np.pi
-            + (self.TMaxHydro + self.TMinHydro) / 2
-        )
-        Tm = (
-            np.arctan(mappedTm) * (self.TMaxHydro - self.TMinHydro) / np.pi
-            + (self.TMaxHydro + self.TMinHydro) / 2
-        )
-        return [Tp, Tm]
+        scale = (self.TMaxHydro - self.TMinHydro) / math.pi
+        center = (self.TMaxHydro + self.TMinHydro) / 2
+        return [
+            math.atan(mappedTp) * scale + center,
+            math.atan(mappedTm) * scale + center,
+        ]
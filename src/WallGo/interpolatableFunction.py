@@ -6,6 +6,7 @@ from abc import ABC, abstractmethod
 from enum import Enum, auto
 from typing import Callable, Tuple
 import logging
+import os
 import numpy as np
 from scipy.interpolate import CubicSpline
 
@@ -14,6 +15,28 @@ from . import helpers
 inputType = list[float] | np.ndarray
 outputType = list[float | np.ndarray] | np.ndarray
 
+## Data of interpolation tables read from disk, keyed by absolute file path and
+## modification time. The arrays are read-only and shared between all objects that
+## read the same file, eg. when a model is constructed repeatedly in a parameter scan.
+_interpolationTableCache: dict[tuple[str, int], np.ndarray] = {}
+
+
+def _loadInterpolationTableData(fileToRead: str) -> np.ndarray:
+    """Reads an interpolation table file, or returns the cached data if the same
+    unmodified file has been read before."""
+    filePath = os.path.abspath(fileToRead)
+    key = (filePath, os.stat(filePath).st_mtime_ns)
+
+    data = _interpolationTableCache.get(key)
+    if data is None:
+        ## Each line should be of form x f(x).
+        ## For vector valued functions, x f1(x) f2(x) ...
+        data = np.loadtxt(filePath, dtype=float, ndmin=2)
+        data.setflags(write=False)
+        _interpolationTableCache[key] = data
+
+    return data
+
 
 class EExtrapolationType(Enum):
     """
@@ -430,6 +453,12 @@ class InterpolatableFunction(ABC):
         if not bUseInterpolatedValues or not self.hasInterpolation():
             return self._evaluateDirectly(x)
 
+        # Fast path: everything is inside the interpolation range, so the spline
+        # can be evaluated on the whole array without masking and scattering.
+        # NaNs fail both comparisons and take the general path below
+        if x.size > 0 and x.min() >= self._rangeMin and x.max() <= self._rangeMax:
+            return self.evaluateInterpolation(x)
+
         # Use interpolated values whenever possible
         canInterpolateCondition, fxShape = self._findInterpolatablePoints(x)
 
@@ -717,6 +746,8 @@ class InterpolatableFunction(ABC):
         Reads precalculated values from a file and does cubic interpolation.
         Each line in the file must be of form x f(x).
         For vector valued functions: x f1(x) f2(x)
+        The file contents are cached, so reading the same unmodified file again
+        does not touch the disk.
 
         Parameters
         ----------
@@ -729,11 +760,7 @@ class InterpolatableFunction(ABC):
         selfName = self.__class__.__name__
 
         try:
-            ## Each line should be of form x f(x).
-            ## For vector valued functions, x f1(x) f2(x) ...
-            data = np.genfromtxt(
-                fileToRead, delimiter=" ", dtype=float, encoding=None
-            )
+            data = _loadInterpolationTableData(fileToRead)
 
             columns = data.shape[1]
 
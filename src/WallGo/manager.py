@@ -370,6 +370,7 @@ class WallGoManager:
             dT,
             rTol=phaseTracerTol,
             phaseTracerFirstStep=self.config.configThermodynamics.phaseTracerFirstStep,
+            phaseTracerMethod=self.config.configThermodynamics.phaseTracerMethod,
         )
         fLowT.tracePhase(
             TMinLowT,
@@ -377,6 +378,7 @@ class WallGoManager:
             dT,
             rTol=phaseTracerTol,
             phaseTracerFirstStep=self.config.configThermodynamics.phaseTracerFirstStep,
+            phaseTracerMethod=self.config.configThermodynamics.phaseTracerMethod,
         )
 
     def setPathToCollisionData(self, directoryPath: pathlib.Path) -> None:
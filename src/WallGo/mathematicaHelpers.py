@@ -3,10 +3,14 @@ Common Wolfram Mathematica and WallGoMatrix related functions.
 Common physics/math functions should go into helpers.py
 """
 
+import collections
 import pathlib
 import subprocess
 import logging
 
+# Number of trailing lines of wolframscript output included in error messages
+OUTPUT_TAIL_LINES = 50
+
 def generateMatrixElementsViaSubprocess(
     inFilePath: pathlib.Path, outFilePath: pathlib.Path
 ) -> None:
@@ -16,9 +20,10 @@ def generateMatrixElementsViaSubprocess(
     This function takes the input and output file paths, converts them to
     string representations, and constructs a command to run a Mathematica
     script using `wolframscript`.
-    The command is executed using the `subprocess.run` method, and
-    the output is printed to the console.
-    If the command fails, an error message is printed.
+    The command is executed using `subprocess.Popen`, and its output is
+    streamed to the console line by line while the script runs.
+    If the command fails, an error message is printed, including the last
+    OUTPUT_TAIL_LINES lines of the script's output.
 
     This requires a licensed installation of WolframEngine.
 
@@ -51,11 +56,28 @@ Input file  : {inFilePathStr}"""
 
     try:
         print(upperBanner)
-        # run wolframscript
-        result = subprocess.run(
-            command, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE
-        )
-        print(result.stdout.decode("utf-8"))  # print the output
+        # run wolframscript. The output is streamed rather than collected, so that
+        # progress is visible during long runs. stderr is merged into stdout, so
+        # that neither pipe can fill up while the other one is being read.
+        with subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        ) as process:
+            assert process.stdout is not None
+            # Only the tail is kept, as the full output can be very long
+            outputTail: collections.deque[str] = collections.deque(
+                maxlen=OUTPUT_TAIL_LINES
+            )
+            for line in process.stdout:
+                print(line, end="")
+                outputTail.append(line)
+        if process.returncode != 0:
+            raise subprocess.CalledProcessError(
+                process.returncode, command, output="".join(outputTail)
+            )
         print(lowerBanner)
 
     except subprocess.CalledProcessError as e:
@@ -65,4 +87,7 @@ Input file  : {inFilePathStr}"""
             Fatal: Error when generating matrix elements from Mathematica via WallGoMatrix.
             Ensure a licensed installation of WolframEngine."""
         )
-        logging.error(e.stderr.decode("utf-8"))
+        logging.error(
+            f"wolframscript exited with code {e.returncode}. "
+            f"Last {OUTPUT_TAIL_LINES} lines of its output:\n{e.output}"
+        )
@@ -332,7 +332,11 @@ class Polynomial:
             compactCoord = compactCoord.reshape((len(axes), 1))
             singlePoint = True
 
-        polynomials = np.ones((compactCoord.shape[1],) + self.coefficients.shape)
+        # The basis values along each evaluated axis are contracted with the
+        # coefficients in one einsum, with the point index shared between them.
+        # This avoids forming the full (points,) + coefficients.shape product.
+        pointIndex = self.rank
+        operands: list[typing.Any] = [self.coefficients, list(range(self.rank))]
         for j, i in enumerate(axes):
             assert (
                 self.basis[i] != "Array"
@@ -374,13 +378,10 @@ class Polynomial:
                 pn = np.array( # pylint: disable=invalid-name
                     self.chebyshev(compactCoord[j, :, None], n[None, :], restriction))
 
-            polynomials *= np.expand_dims(
-                pn, tuple(np.arange(1, i + 1)) + tuple(np.arange(i + 2, self.rank + 1))
-            )
+            operands += [pn, [pointIndex, int(i)]]
 
-        result = np.sum(
-            self.coefficients[None, ...] * polynomials, axis=tuple(np.array(axes) + 1)
-        )
+        outputIndices = [pointIndex] + [i for i in range(self.rank) if i not in axes]
+        result = np.einsum(*operands, outputIndices, optimize=True)
         if singlePoint:
             return float(result[0])
         return np.array(result)
@@ -236,22 +236,24 @@ class Thermodynamics:
             return float(diff.item())
 
         # start from TMax and decrease temperature in small steps until
-        # the free energy difference changes sign
-        T = TMax
+        # the free energy difference changes sign. The free energies accept
+        # arrays, so the whole scan is done with one vectorized evaluation
         TStep = dT
-        signAtStart = np.sign(freeEnergyDifference(T))
-        bConverged = False
-
-        while T-TStep > TMin:
-            T -= TStep
-            if np.sign(freeEnergyDifference(T)) != signAtStart:
-                bConverged = True
-                break
+        TScan = TMax - TStep * np.arange(int((TMax - TMin) / TStep) + 1)
+        TScan = TScan[TScan > TMin]
+        differenceScan = np.ravel(
+            self.freeEnergyLow(TScan).veffValue - self.freeEnergyHigh(TScan).veffValue
+        )
+        signChanges = np.flatnonzero(
+            np.sign(differenceScan[1:]) != np.sign(differenceScan[0])
+        )
 
-        if not bConverged:
+        if signChanges.size == 0:
             raise WallGoError("Could not find critical temperature. "\
                               "Try changing the temperature scale.")
 
+        T = TScan[signChanges[0] + 1]
+
         # Improve Tc estimate by solving DeltaF = 0 in narrow range near T
         # NB: bracket will break if the function has same sign on both ends.
         # The rough loop above should prevent this.
@@ -297,8 +299,7 @@ class Thermodynamics:
                 - self.epsilonMaxHighT
             )
 
-        veffValue = self.freeEnergyHigh(temperature).veffValue
-        return -veffValue
+        return -self.freeEnergyHigh.evaluateVeff(temperature)
 
     def dpHighT(self, temperature: np.ndarray | float) -> np.ndarray | float:
         """
@@ -332,7 +333,7 @@ class Thermodynamics:
                 * pow(temperature, self.muMaxHighT - 1)
             )
 
-        return -self.freeEnergyHigh.derivative(temperature, order=1).veffValue
+        return -self.freeEnergyHigh.evaluateVeff(temperature, order=1)
 
     def ddpHighT(self, temperature: np.ndarray | float) -> np.ndarray | float:
         """
@@ -368,7 +369,7 @@ class Thermodynamics:
                 * pow(temperature, self.muMaxHighT - 2)
             )
 
-        return -self.freeEnergyHigh.derivative(temperature, order=2).veffValue
+        return -self.freeEnergyHigh.evaluateVeff(temperature, order=2)
 
     def eHighT(self, temperature: np.ndarray | float) -> np.ndarray | float:
         r"""
@@ -469,8 +470,7 @@ class Thermodynamics:
                 - self.epsilonMaxLowT
             )
 
-        veffValue = self.freeEnergyLow(temperature).veffValue
-        return -veffValue
+        return -self.freeEnergyLow.evaluateVeff(temperature)
 
     def dpLowT(self, temperature: np.ndarray | float) -> np.ndarray | float:
         """
@@ -503,7 +503,7 @@ class Thermodynamics:
                 * pow(temperature, self.muMaxLowT - 1)
             )
 
-        return -self.freeEnergyLow.derivative(temperature, order=1).veffValue
+        return -self.freeEnergyLow.evaluateVeff(temperature, order=1)
 
     def ddpLowT(self, temperature: np.ndarray | float) -> np.ndarray | float:
         """
@@ -539,7 +539,7 @@ class Thermodynamics:
                 * pow(temperature, self.muMaxLowT - 2)
             )
 
-        return -self.freeEnergyLow.derivative(temperature, order=2).veffValue
+        return -self.freeEnergyLow.evaluateVeff(temperature, order=2)
 
     def eLowT(self, temperature: np.ndarray | float) -> np.ndarray | float:
         r"""
@@ -2,7 +2,7 @@ import pytest
 import numpy as np
 from typing import Tuple
 
-from tests.BenchmarkPoint import BenchmarkPoint
+from tests.BenchmarkPoint import BenchmarkPoint, BenchmarkModel
 
 import WallGo
 
@@ -47,3 +47,64 @@ def test_freeEnergy_singletSimple(
     assert vExact == pytest.approx(v, rel=rTol)
     assert 0 == pytest.approx(x, abs=aTol)
     assert f0 + VvExact == pytest.approx(veffValue, rel=rTol)
+
+
+@pytest.mark.parametrize("T", [90, 110])
+def test_freeEnergy_singletSimple_Radau(
+    singletSimpleBenchmarkModel: BenchmarkModel,
+    T: float,
+):
+    """
+    Testing that phase tracing with the implicit Radau solver agrees with the
+    exact result
+    """
+    BM = singletSimpleBenchmarkModel.benchmarkPoint
+    Veff = singletSimpleBenchmarkModel.model.getEffectivePotential()
+
+    freeEnergy = WallGo.FreeEnergy(
+        Veff, BM.phaseInfo["Tn"], BM.expectedResults["phaseLocation2"]
+    )
+    freeEnergy.tracePhase(
+        50.0, 150.0, 0.1, rTol=1e-6, paranoid=False, phaseTracerMethod="Radau"
+    )
+
+    # exact results
+    thermalParameters = Veff.getThermalParameters(T)
+    f0 = -107.75 * np.pi ** 2 / 90 * T ** 4
+    vExact = np.sqrt(-thermalParameters["muHsq"] / thermalParameters["lHH"])
+    VvExact = -0.25 * thermalParameters["muHsq"] ** 2 / thermalParameters["lHH"]
+
+    rTol = 1e-5
+    f: WallGo.FreeEnergyValueType = freeEnergy(T)
+
+    assert vExact == pytest.approx(f.fieldsAtMinimum.getField(0), rel=rTol)
+    assert 0 == pytest.approx(f.fieldsAtMinimum.getField(1), abs=rTol * T)
+    assert f0 + VvExact == pytest.approx(f.veffValue, rel=rTol)
+
+
+@pytest.mark.parametrize("T", [90, 110])
+def test_freeEnergy_evaluateVeff(
+    singletSimpleBenchmarkFreeEnergy: Tuple[WallGo.FreeEnergy, WallGo.FreeEnergy, BenchmarkPoint],
+    T: float,
+):
+    """
+    Testing that the Veff-only evaluation agrees with the full FreeEnergy evaluation
+    """
+    freeEnergy1, freeEnergy2, _ = singletSimpleBenchmarkFreeEnergy
+
+    for freeEnergy in (freeEnergy1, freeEnergy2):
+        assert freeEnergy.evaluateVeff(T) == pytest.approx(
+            freeEnergy(T).veffValue, rel=1e-12
+        )
+        for order in (1, 2):
+            assert freeEnergy.evaluateVeff(T, order) == pytest.approx(
+                freeEnergy.derivative(T, order).veffValue, rel=1e-12
+            )
+
+
+def test_freeEnergy_invalidPhaseTracerMethod(
+    singletSimpleBenchmarkFreeEnergy: Tuple[WallGo.FreeEnergy, WallGo.FreeEnergy, BenchmarkPoint],
+):
+    freeEnergy1, _, _ = singletSimpleBenchmarkFreeEnergy
+    with pytest.raises(ValueError):
+        freeEnergy1.tracePhase(50.0, 150.0, 0.1, phaseTracerMethod="LSODA")
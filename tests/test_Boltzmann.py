@@ -56,20 +56,22 @@ def test_Delta00(
     msq = particle.msqVacuum(bg.fieldProfiles)
     ## Drop start and end points in field space
     msq = msq[1:-1, np.newaxis, np.newaxis]
-    energy = np.sqrt(msq + pz**2 + pp**2)
+    # p^2 on the momentum grid, then a single (M, N, N) array for the energy
+    energy = msq + (pz**2 + pp**2)
+    np.sqrt(energy, out=energy)
 
-    # integrand with known result
+    # integrand with known result. Only the energy depends on position, and the
+    # momentum dependence factorises into a rz part and a rp part
     eps = 2e-16
-    integrandAnalytic = (
+    rzFactor = (1 - rz**2) * np.sqrt(1 - rz**2) * (a + b * rz + c * rz**2)
+    rpFactor = (
         2
-        * energy
-        * (1 - rz**2)
         * (1 - rp**2)
-        * np.sqrt((1 - rz**2) * (1 - rp) ** 2 / (1 - rp**2 + eps))
+        * np.sqrt((1 - rp) ** 2 / (1 - rp**2 + eps))
         / (np.log(2 / (1 - rp)) + eps)
+        * (d + e * rp + f * rp**2)
     )
-    integrandAnalytic *= a + b * rz + c * rz**2
-    integrandAnalytic *= d + e * rp + f * rp**2
+    integrandAnalytic = energy * (rzFactor * rpFactor)
 
     # doing computation
     boltzmannResults = boltzmann.getDeltas(integrandAnalytic[None, ...])
@@ -2,6 +2,21 @@ import pytest
 import numpy as np
 import WallGo
 
+
+def _integrationWeight(grid, pSq):
+    r"""
+    Integration weight :math:`\frac{dz}{d\chi}\frac{dp_z}{d\rho_z}\frac{dp_\Vert}{d\rho_\Vert}\frac{p_\Vert}{2p^2}`,
+    built on the momentum grid so that only the last product is a full
+    (M, N, N) array.
+    """
+    dxidchi, dpzdrz, dppdrp = grid.getCompactificationDerivatives()
+    weight = dppdrp * grid.ppValues / 2
+    weight = weight[None,None,:] / pSq
+    weight *= dpzdrz[None,:,None]
+    weight = dxidchi[:,None,None] * weight
+    return weight
+
+
 @pytest.mark.parametrize(
     "wallThickness, tails, ratio",
     [
@@ -27,16 +42,23 @@ def test_integration(wallThickness, tails, ratio):
     
     m = lambda z: 1-np.tanh(z)
     dmdz = lambda z: -1/np.cosh(z)**2
-    p = lambda pz, pp: np.sqrt(pz**2+pp**2)
-    E = lambda z, pz, pp: np.sqrt(p(pz,pp)**2+m(z)**2)
-    func = lambda z, pz, pp: dmdz(z)*p(pz,pp)/(E(z,pz,pp)*(np.exp(E(z,pz,pp))+1))
     
-    polyCoeff = func(grid.xiValues[:,None,None,], grid.pzValues[None,:,None], grid.ppValues[None,None,:])
+    # p^2 only depends on the momenta, and E is evaluated once. Only E and
+    # polyCoeff are full (M, N, N) arrays, everything else is done in place
+    z = grid.xiValues[:,None,None]
+    pSq = grid.pzValues[None,:,None]**2 + grid.ppValues[None,None,:]**2
+    E = pSq + m(z)**2
+    np.sqrt(E, out=E)
+    polyCoeff = np.exp(E)
+    polyCoeff += 1
+    polyCoeff *= E
+    np.reciprocal(polyCoeff, out=polyCoeff)
+    polyCoeff *= np.sqrt(pSq)
+    polyCoeff *= dmdz(z)
     polynomial = WallGo.Polynomial(polyCoeff, grid, direction=('z','pz','pp'))
     
     integralExact = -0.6914545487096899
-    dxidchi, dpzdrz, dppdrp = grid.getCompactificationDerivatives()
-    integralPoly = polynomial.integrate(weight=dxidchi[:,None,None]*dpzdrz[None,:,None]*dppdrp[None,None,:]*grid.ppValues[None,None,:]/(grid.ppValues[None,None,:]**2+grid.pzValues[None,:,None]**2)/2)
+    integralPoly = polynomial.integrate(weight=_integrationWeight(grid, pSq))
     
     assert np.isclose(integralExact, integralPoly,rtol=0,atol=1e-3)
     
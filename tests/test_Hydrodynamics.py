@@ -1,4 +1,5 @@
 import pytest
+import warnings
 from dataclasses import dataclass
 import numpy as np
 from scipy.integrate import odeint
@@ -148,6 +149,16 @@ def test_matchDeton():
     res = hydrodynamics.matchDeton(1.1*hydrodynamics.vJ)
     np.testing.assert_allclose(res,(0.71697,0.690044,0.9,0.931932),rtol = 10**-3,atol = 0)
 
+def test_matchDetonCallOrder():
+    # The result must only depend on vw, not on earlier calls
+    for model1 in [TestModel2Step(0.2,0.1,0.4,0.7), TestModelBag(0.9,0.8)]:
+        hydrodynamics = WallGo.Hydrodynamics(model1, tmax, tmin, rtol, atol)
+        vJ = hydrodynamics.vJ
+        for vw in [0.99, 1.01*vJ, 0.9, 0.991, 1.05*vJ, 0.5*(1+vJ), 1.011*vJ]:
+            res = hydrodynamics.matchDeton(vw)
+            hydrodynamicsFresh = WallGo.Hydrodynamics(model1, tmax, tmin, rtol, atol)
+            np.testing.assert_array_equal(res, hydrodynamicsFresh.matchDeton(vw))
+
 def test_matchDeflagOrHyb():
     #This does not depend on the nucleation temperature, so no need to reinitialize model1
     hydrodynamics = WallGo.Hydrodynamics(model1, tmax, tmin, rtol, atol)
@@ -160,6 +171,33 @@ def test_matchDeflagOrHyb():
     res = hydrodynamics.matchDeflagOrHyb(0.7, 0.4)
     np.testing.assert_allclose(res,(0.4,0.547745,0.814862,0.734061),rtol = 10**-3,atol = 0)
 
+def test_matchDeflagOrHybCallOrder():
+    # The result must only depend on the arguments, not on earlier calls
+    model1 = TestModel2Step(0.2,0.1,0.4,0.7)
+    hydrodynamics = WallGo.Hydrodynamics(model1, tmax, tmin, rtol, atol)
+    for vw, vp in [(0.5,0.4), (0.505,0.401), (0.3,0.2), (0.3,0.2005), (0.6,None), (0.605,None)]:
+        res = hydrodynamics.matchDeflagOrHyb(vw, vp)
+        hydrodynamicsFresh = WallGo.Hydrodynamics(model1, tmax, tmin, rtol, atol)
+        np.testing.assert_array_equal(res, hydrodynamicsFresh.matchDeflagOrHyb(vw, vp))
+        # Starting from a nearby solution converges to the same matching
+        resGuess = hydrodynamics.matchDeflagOrHyb(vw, vp, initialGuess=[1.01*res[2], 0.99*res[3]])
+        np.testing.assert_allclose(resGuess, res, rtol = 10**-5, atol = 0)
+
+def test_matchDeflagOrHybZeroGuess(monkeypatch):
+    # A vanishing template guess falls back to the default guess, like a NaN one,
+    # instead of dividing by zero
+    model1 = TestModel2Step(0.2,0.1,0.4,0.7)
+    hydrodynamics = WallGo.Hydrodynamics(model1, tmax, tmin, rtol, atol)
+    monkeypatch.setattr(hydrodynamics.template, "matchDeflagOrHybInitial", lambda vw, vp: [np.nan, np.nan])
+    resNaN = hydrodynamics.matchDeflagOrHyb(0.5, 0.4)
+
+    hydrodynamics = WallGo.Hydrodynamics(model1, tmax, tmin, rtol, atol)
+    monkeypatch.setattr(hydrodynamics.template, "matchDeflagOrHybInitial", lambda vw, vp: [0.8, 0.])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        res = hydrodynamics.matchDeflagOrHyb(0.5, 0.4)
+    np.testing.assert_array_equal(res, resNaN)
+
 def test_solveHydroShock():
     res = hydrodynamics.solveHydroShock(0.5, 0.4,0.825993)
     assert res == pytest.approx(0.77525, rel=0.01)
@@ -218,6 +256,11 @@ def test_findMatching():
     res = hydrodynamics.findMatching(0.9)
     np.testing.assert_allclose(res,(0.9, 0.894957,0.9,0.918446),rtol = 10**-2,atol = 0)
 
+    model1 = TestModelBag(0.9,0.9)
+    hydrodynamics = WallGo.Hydrodynamics(model1, tmax, tmin, rtol, atol)
+    res = hydrodynamics.findMatching(0.4)
+    np.testing.assert_allclose(res,(0.323759,0.4,0.936156,0.897265),rtol = 10**-2,atol = 0)
+
 
 # Test efficiency factor in two-step model
 def test_efficiencyFactor():
@@ -1,3 +1,4 @@
+import os
 import numpy as np
 import pytest
 
@@ -95,6 +96,21 @@ def test_outOfBoundsMixed() -> None:
 
     with pytest.raises(ValueError):
         f([0.0, 2., 55.0])
+
+
+def test_inRangeMatchesMixed() -> None:
+    """All-in-range input should agree with the same points evaluated alongside
+    an out-of-bounds point"""
+    f = DumbVectorFunction()
+    f.setExtrapolationType(EExtrapolationType.CONSTANT, EExtrapolationType.CONSTANT)
+    f.newInterpolationTable(1.0, 10.0, 10)
+
+    x = np.array([[1.0, 2.5], [7.3, 10.0]])
+    resInRange = f(x)
+    resMixed = f(np.append(x.ravel(), 20.0))
+
+    assert resInRange.shape == (2, 2, 4)
+    np.testing.assert_array_equal(resInRange.reshape(4, 4), resMixed[:4])
     
 def test_outOfBoundsNoExtrapolation() -> None:
     """"""
@@ -124,4 +140,27 @@ def test_outOfBoundsExtrapolateInterpolation(x: float | list[float]) -> None:
     f.newInterpolationTable(1.0, 10.0, 10)
 
     # Shouldn't be exactly equal to directly evaluated values
-    np.testing.assert_raises(AssertionError, np.testing.assert_array_equal, f(x, bUseInterpolatedValues=False), f(x))
\ No newline at end of file
+    np.testing.assert_raises(AssertionError, np.testing.assert_array_equal, f(x, bUseInterpolatedValues=False), f(x))
+
+def test_readInterpolationTableTwice(tmp_path) -> None:
+    """Reading a table again gives the same interpolation, and picks up changes
+    to the file"""
+    f = DumbVectorFunction()
+    f.newInterpolationTable(1.0, 10.0, 10)
+    fileName = str(tmp_path / "table.txt")
+    f.writeInterpolationTable(fileName)
+
+    g1 = DumbVectorFunction()
+    g1.readInterpolationTable(fileName)
+    g2 = DumbVectorFunction()
+    g2.readInterpolationTable(fileName)
+    np.testing.assert_array_equal(g1(5.5), g2(5.5))
+
+    f.newInterpolationTable(2.0, 8.0, 10)
+    f.writeInterpolationTable(fileName)
+    stat = os.stat(fileName)
+    os.utime(fileName, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    g3 = DumbVectorFunction()
+    g3.readInterpolationTable(fileName)
+    assert g3.interpolationRangeMin() == pytest.approx(2.0)
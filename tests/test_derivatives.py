@@ -95,7 +95,22 @@ def test_derivative(
         f_analytic, xRange, n=n, order=order, bounds=bounds
     )
     np.testing.assert_allclose(deriv_WallGo, deriv_analytic, atol=0, rtol=rTol)
-    
+
+
+@pytest.mark.parametrize("n", [1, 2])
+def test_derivative_singleEvaluation(xRange, n: int):
+    """
+    Tests that derivative evaluates the function only once, on all stencil points
+    """
+    calls = []
+
+    def f(x):
+        calls.append(x.shape)
+        return f_analytic(x)
+
+    WallGo.helpers.derivative(f, xRange, n=n)
+    assert len(calls) == 1
+
 @pytest.mark.parametrize(
     "order, scaleRatio, rTol, axis",
     [
@@ -149,3 +164,14 @@ def test_hessian(multivariateRange, order: int, scaleRatio: float, rTol: float,
         hessian_analytic = hessian_analytic[...,axis]
     hessian_WallGo = WallGo.helpers.hessian(fMultivariate_analytic, multivariateRange, order, 1e-12, [1,scaleRatio], yAxis=axis, args=(scaleRatio,))
     np.testing.assert_allclose(hessian_analytic, hessian_WallGo, atol=0, rtol=rTol)
+
+@pytest.mark.parametrize("size", [1, 2, 3])
+def test_minEigenvalueSym(size: int):
+    """
+    Tests the closed-form smallest eigenvalue against numpy
+    """
+    rng = np.random.default_rng(5)
+    matrix = rng.normal(size=(size, size))
+    matrix = matrix + matrix.T
+    minEig = WallGo.helpers.minEigenvalueSym(matrix)
+    assert minEig == pytest.approx(np.linalg.eigvalsh(matrix)[0], rel=1e-12)
@@ -4,3 +4,31 @@
 def test_importWallGo() -> None:
     """Testing import of WallGo"""
     import WallGo
+
+
+def test_lazyAttributes() -> None:
+    """Testing that lazily imported names and submodules resolve"""
+    import pytest
+    import WallGo
+
+    from WallGo import Fields, Hydrodynamics
+
+    assert Fields is WallGo.fields.Fields
+    assert Hydrodynamics is WallGo.hydrodynamics.Hydrodynamics
+    assert "WallGoManager" in dir(WallGo)
+
+    with pytest.raises(AttributeError):
+        _ = WallGo.notAnAttribute
+
+
+def test_starImport() -> None:
+    """Testing that `from WallGo import *` exports the lazily imported names"""
+    import WallGo
+
+    namespace: dict = {}
+    exec("from WallGo import *", namespace)  # pylint: disable=exec-used
+
+    assert namespace["Hydrodynamics"] is WallGo.Hydrodynamics
+    assert "isCollisionModuleAvailable" in namespace
+    # The availability check runs at import time
+    assert WallGo._bCollisionModuleAvailable is not None  # pylint: disable=protected-access
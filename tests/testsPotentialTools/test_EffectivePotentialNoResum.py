@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from WallGo import PotentialTools
+
+
+class SimpleEffectivePotentialNoResum(PotentialTools.EffectivePotentialNoResum):
+    """Minimal concrete potential for testing the one-loop functions, which
+    take the particle spectrum directly"""
+
+    fieldCount = 1
+    effectivePotentialError = 1e-15
+
+    def evaluate(self, fields, temperature):  # type: ignore[no-untyped-def]
+        return 0
+
+    def bosonInformation(self, fields, temperature):  # type: ignore[no-untyped-def]
+        raise NotImplementedError
+
+    def fermionInformation(self, fields, temperature):  # type: ignore[no-untyped-def]
+        raise NotImplementedError
+
+
+@pytest.mark.parametrize(
+    "imaginaryOption, expectedResult",
+    [
+        (PotentialTools.EImaginaryOption.PRINCIPAL_PART, [0.0722269, 0.05070007]),
+        (PotentialTools.EImaginaryOption.ABS_RESULT, [0.0749167, 0.05285004]),
+    ],
+)
+def test_potentialOneLoopNegativeFermionMass(
+    imaginaryOption: PotentialTools.EImaginaryOption, expectedResult: list[float]
+) -> None:
+    """Nonnegative boson masses with a negative fermion mass squared, so that only
+    the fermion sum is complex"""
+    bosons = (
+        np.array([[1.0, 2.0], [0.5, 4.0]]),
+        np.array([3.0, 1.0]),
+        np.array([1.5, 0.5]),
+        1.0,
+    )
+    fermions = (np.array([[-1.0, 3.0], [2.0, -0.5]]), np.array([4.0, 12.0]), 1.5, 1.0)
+
+    potential = SimpleEffectivePotentialNoResum(imaginaryOption=imaginaryOption)
+    result = potential.potentialOneLoop(bosons, fermions)
+    assert result == pytest.approx(expectedResult, rel=1e-6)
+
+
+def test_jCWBroadcasting() -> None:
+    """Degrees of freedom broadcasting to a larger shape than the masses"""
+    massSq = np.array([[0.5], [2.0], [-1.0]])
+    degreesOfFreedom = np.array([1.0, 3.0])
+
+    result = PotentialTools.EffectivePotentialNoResum.jCW(
+        massSq, degreesOfFreedom, 1.5, 1.0
+    )
+    expectedResult = (
+        degreesOfFreedom
+        * massSq**2
+        * (np.log(massSq + 1e-100j) - 1.5)
+        / (64 * np.pi**2)
+    )
+    assert result.shape == (3, 2)
+    np.testing.assert_allclose(result, expectedResult, rtol=1e-12)
+
+
+@pytest.mark.parametrize("massSqMin", [0.0, -2.0])
+def test_jCWNumexpr(monkeypatch: pytest.MonkeyPatch, massSqMin: float) -> None:
+    """The numexpr evaluation of jCW agrees with the NumPy one, for real and for
+    complex results"""
+    numexpr = pytest.importorskip("numexpr")
+    from WallGo.PotentialTools import effectivePotentialNoResum
+
+    rng = np.random.default_rng(42)
+    massSq = rng.uniform(massSqMin, 5.0, size=(100, 3))
+    massSq[0, 0] = 0.0
+    degreesOfFreedom = np.array([1.0, 3.0, 12.0])
+    c = np.array([1.5, 0.5, 1.5])
+    rgScale = np.array([1.0, 1.0, 2.0])
+
+    # Use numexpr regardless of the array size
+    monkeypatch.setattr(
+        PotentialTools.EffectivePotentialNoResum, "NUMEXPR_MIN_SIZE", 0
+    )
+    monkeypatch.setattr(effectivePotentialNoResum, "numexpr", numexpr)
+    resultNumexpr = PotentialTools.EffectivePotentialNoResum.jCW(
+        massSq, degreesOfFreedom, c, rgScale
+    )
+
+    monkeypatch.setattr(effectivePotentialNoResum, "numexpr", None)
+    resultNumpy = PotentialTools.EffectivePotentialNoResum.jCW(
+        massSq, degreesOfFreedom, c, rgScale
+    )
+
+    assert np.iscomplexobj(resultNumexpr) == (massSqMin < 0)
+    assert resultNumexpr.dtype == resultNumpy.dtype
+    np.testing.assert_allclose(resultNumexpr, resultNumpy, rtol=1e-12, atol=1e-14)